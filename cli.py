@@ -2,29 +2,75 @@
 """Command-line interface for STT service."""
 
 import argparse
+import os
 import sys
-from pathlib import Path
-import time
 
-from stt_service.core.config import Config
-from stt_service.service import STTService
-from stt_service.core.logger import setup_logging, get_logger, log_operation_start, log_operation_success, log_operation_error
+# Heavy stt_service modules (engines, audio, input/output backends) are
+# imported inside the subcommand handlers so that ``--help`` and argument
+# errors never pay their import cost.
+logger = None
 
-logger = get_logger(__name__)
+DESCRIPTION = 'Self-hosted Speech-to-Text Service'
 
-
-def main():
-    """Main entry point for CLI."""
-    parser = argparse.ArgumentParser(
-        description='Self-hosted Speech-to-Text Service',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+EPILOG = """
 Examples:
   %(prog)s run                        # Run with default config
   %(prog)s run -c config.yaml         # Run with custom config
   %(prog)s config                     # Show current configuration
   %(prog)s config --create            # Create example config file
         """
+
+# Top-level help printed without building the argparse tree; must match
+# build_parser().format_help(), which test_cli checks.
+STATIC_HELP = """usage: %(prog)s [-h] [-V] [-v] {run,config,test} ...
+
+""" + DESCRIPTION + """
+
+positional arguments:
+  {run,config,test}  Command to execute
+    run              Run the STT service
+    config           Manage configuration
+    test             Test components
+
+options:
+  -h, --help         show this help message and exit
+  -V, --version      show program's version number and exit
+  -v, --verbose      Enable verbose logging
+""" + EPILOG + "\n"
+
+
+def _fast_path(argv):
+    """Handle ``--version`` and top-level ``--help`` before argparse is built.
+    
+    Args:
+        argv: Command-line arguments (without program name)
+    """
+    if argv and argv[0] in ('-V', '--version'):
+        from stt_service._version import __version__
+        print(f"stt-service {__version__}")
+        sys.exit(0)
+    
+    if not argv or argv[0] in ('-h', '--help'):
+        # write(), like ArgumentParser.print_help: the text ends in a newline
+        sys.stdout.write(STATIC_HELP % {'prog': os.path.basename(sys.argv[0])})
+        # No command given is a usage error, like the argparse path
+        sys.exit(0 if argv else 1)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the full argument parser, with every subcommand."""
+    from stt_service._version import __version__
+    
+    parser = argparse.ArgumentParser(
+        description=DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
+    )
+    
+    parser.add_argument(
+        '-V', '--version',
+        action='version',
+        version=f'stt-service {__version__}'
     )
     
     parser.add_argument(
@@ -89,11 +135,21 @@ Examples:
         help='Component to test'
     )
     
+    return parser
+
+
+def main():
+    """Main entry point for CLI."""
+    _fast_path(sys.argv[1:])
+    
+    parser = build_parser()
     args = parser.parse_args()
     
-    # Set up logging
-    # Setup loguru logging
+    # Setup loguru logging (only once a subcommand is actually dispatched)
+    global logger
+    from stt_service.core.logger import setup_logging, get_logger
     setup_logging()
+    logger = get_logger(__name__)
     
     if args.verbose:
         logger.info("Verbose logging enabled")
@@ -118,6 +174,9 @@ def run_service(args):
     Args:
         args: Parsed command-line arguments
     """
+    from stt_service.core.config import Config
+    from stt_service.service import STTService
+    
     try:
         # Load configuration
         config = Config(args.config if hasattr(args, 'config') else None)
@@ -158,12 +217,30 @@ def manage_config(args):
         create_example_config(args.output)
 
 
+def _yaml():
+    """Import PyYAML on first use and return ``(yaml, Dumper)``.
+    
+    The first call replaces this function with one that returns the cached
+    pair, so later calls skip the import machinery entirely.
+    """
+    global _yaml
+    import yaml
+    try:
+        from yaml import CDumper as Dumper  # libyaml-backed, much faster
+    except ImportError:
+        from yaml import Dumper
+    result = (yaml, Dumper)
+    _yaml = lambda: result
+    return result
+
+
 def create_example_config(output_path: str):
     """Create example configuration file.
     
     Args:
         output_path: Path to save configuration file
     """
+    from stt_service.core.config import Config
     config = Config()
     
     try:
@@ -177,13 +254,14 @@ def create_example_config(output_path: str):
 
 def show_config():
     """Show current configuration."""
+    from stt_service.core.config import Config
     config = Config()
     
     print("Current Configuration:")
     print("=" * 50)
     
-    import yaml
-    print(yaml.dump(config.config, default_flow_style=False))
+    yaml, Dumper = _yaml()
+    print(yaml.dump(config.config, Dumper=Dumper, default_flow_style=False))
 
 
 def test_components(args):
@@ -197,14 +275,49 @@ def test_components(args):
     print(f"Testing {component}...")
     print("=" * 50)
     
-    if component in ['audio', 'all']:
-        test_audio()
+    tests = {
+        'audio': test_audio,
+        'keyboard': test_keyboard,
+        'clipboard': test_clipboard,
+    }
+    
+    if component == 'all':
+        _prewarm_imports(COMPONENT_MODULES.values())
+        for test in tests.values():
+            test()
+    else:
+        tests[component]()
+
+
+# Third-party backends probed by each component test
+COMPONENT_MODULES = {
+    'audio': 'sounddevice',
+    'keyboard': 'pynput.keyboard',
+    'clipboard': 'pyperclip',
+}
+
+
+def _prewarm_imports(module_names):
+    """Import backend libraries concurrently.
+    
+    The tests themselves still run one after another so their output is not
+    interleaved; they just find the slow imports already in ``sys.modules``.
+    Import errors are left for the individual tests to report.
+    
+    Args:
+        module_names: Dotted module names to import
+    """
+    import importlib
+    from concurrent.futures import ThreadPoolExecutor
     
-    if component in ['keyboard', 'all']:
-        test_keyboard()
+    def _import(name):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
     
-    if component in ['clipboard', 'all']:
-        test_clipboard()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(_import, module_names))
 
 
 def test_audio():
@@ -117,8 +117,8 @@ def test_engine():
     assert engine.is_ready(), "Engine not ready"
     print("✓ Engine is ready")
     
-    # Create dummy audio
-    audio = np.random.randn(16000).astype(np.float32)
+    # Create dummy audio (content is irrelevant for the dummy engine)
+    audio = np.zeros(16000, dtype=np.float32)
     print(f"✓ Created test audio: {len(audio)} samples")
     
     # Transcribe
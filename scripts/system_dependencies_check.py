@@ -3,22 +3,46 @@ import sys
 
 print('Testing system dependencies...')
 
+def _parse_import_time(stderr, module_name):
+    """Return the cumulative import time (ms) of module_name from -X importtime output."""
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        # import time: self [us] | cumulative | imported package
+        fields = line[len('import time:'):].split('|')
+        if len(fields) == 3 and fields[2].strip() == module_name:
+            return int(fields[1]) / 1000.0
+    return None
+
 def test_import(module_name):
+    # Each module is imported in a fresh interpreter so that shared transitive
+    # dependencies (numpy, torch, X11 bindings) are not already loaded by a
+    # previous check and the reported time is the real cold-import cost.
     try:
-        __import__(module_name)
-        return True
-    except ImportError as e:
-        print(f'❌ {module_name}: {e}')
-        return False
-    except Exception as e:
-        print(f'⚠️  {module_name}: {e}')
-        return True
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+            capture_output=True, text=True, timeout=30
+        )
+    except subprocess.TimeoutExpired:
+        print(f'⚠️  {module_name}: import timed out after 30s')
+        return None
+
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'unknown error'
+        if error.startswith(('ImportError', 'ModuleNotFoundError')):
+            print(f'❌ {module_name}: {error}')
+            return None
+        # Installed, but failed while initialising (e.g. no X display)
+        print(f'⚠️  {module_name}: {error}')
+
+    elapsed = _parse_import_time(result.stderr, module_name)
+    return elapsed if elapsed is not None else 0.0
 
 # Test critical imports
 modules = {
     'sounddevice': 'Audio capture (needs PortAudio)',
     'pyautogui': 'Keyboard automation (needs X11 libs)',
-    'pynput': 'Input capture (needs X11 libs)',  
+    'pynput': 'Input capture (needs X11 libs)',
     'keyboard': 'Hotkey detection',
     'whisper': 'Speech-to-text engine'
 }
@@ -27,8 +51,9 @@ def test_dependencies():
     print("Testing System Dependencies")
     print("="*60)
     for module, description in modules.items():
-        if test_import(module):
-            print(f'✅ {module} - {description}')
+        elapsed = test_import(module)
+        if elapsed is not None:
+            print(f'✅ {module} - {description} ({elapsed:.0f} ms import time)')
 
 if __name__ == "__main__":
     test_dependencies()
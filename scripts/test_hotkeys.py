@@ -1,18 +1,23 @@
 from pynput.keyboard import GlobalHotKeys
-import time
+import threading
 
 # from cli import test_keyboard
 
+detected_event = threading.Event()
+
 def detected():
     print('✅ HOTKEY WORKS!')
+    detected_event.set()
 
 def test_hotkeys():
-    hotkeys = GlobalHotKeys({'<ctrl>+<shift>+<space>': detected})
-    hotkeys.start()
-    print('Press Ctrl+Shift+Space...')
-    time.sleep(10)
-    hotkeys.stop()
+    detected_event.clear()
+    # The context manager stops the listener even if waiting is interrupted
+    with GlobalHotKeys({'<ctrl>+<shift>+<space>': detected}):
+        print('Press Ctrl+Shift+Space...')
+        # Return as soon as the hotkey fires instead of always waiting 10s
+        if not detected_event.wait(timeout=10):
+            print('No hotkey detected within 10 seconds')
 
 
 if __name__ == '__main__':
-    test_hotkeys()
\ No newline at end of file
+    test_hotkeys()
@@ -3,12 +3,17 @@ from setuptools import setup, find_packages
 with open('README.md', 'r', encoding='utf-8') as f:
     long_description = f.read()
 
+version = {}
+with open('stt_service/_version.py', 'r', encoding='utf-8') as f:
+    # Read, not imported: the package is not importable before it is installed
+    exec(f.read(), version)
+
 with open('requirements.txt', 'r', encoding='utf-8') as f:
     requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
 
 setup(
     name='stt-service',
-    version='0.1.0',
+    version=version['__version__'],
     description='Self-hosted Speech-to-Text Service for Pop!_OS (Linux)',
     long_description=long_description,
     long_description_content_type='text/markdown',
@@ -20,8 +25,12 @@ setup(
         'test': [
             'pytest>=6.0',
             'pytest-cov>=2.0',
+            'pytest-xdist>=2.0',
             'mock>=4.0',
         ],
+        'numba': [
+            'numba>=0.56',
+        ],
     },
     entry_points={
         'console_scripts': [
@@ -1,9 +1,23 @@
 """STT Service - Self-hosted Speech-to-Text Service."""
 
-__version__ = '0.1.0'
-__author__ = 'Marc Humet'
+from ._version import __version__
 
-from .core.config import Config
-from .service import STTService
+__author__ = 'Marc Humet'
 
 __all__ = ['Config', 'STTService']
+
+
+def __getattr__(name):
+    """Import public classes on first access.
+
+    Importing any ``stt_service`` submodule runs this package first, so eager
+    imports here would drag the audio, engine and input/output backends into
+    every entry point (including ``cli.py --help``).
+    """
+    if name == 'Config':
+        from .core.config import Config
+        return Config
+    if name == 'STTService':
+        from .service import STTService
+        return STTService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
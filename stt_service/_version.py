@@ -0,0 +1,3 @@
+"""Package version, importable without loading any service module."""
+
+__version__ = '0.1.0'
@@ -1,11 +1,11 @@
 """Audio capture module for recording microphone input."""
 
 import numpy as np
-from typing import Optional, Callable
-import threading
+from typing import Optional, Callable, List
 import queue
 import time
 
+from .dsp import chunk_energy
 from .logger import get_logger, log_malfunction, log_audio_event, log_performance
 
 logger = get_logger(__name__)
@@ -14,11 +14,25 @@ logger = get_logger(__name__)
 class AudioCapture:
     """Handle audio recording from microphone."""
     
+    # sounddevice module, shared by all instances once imported
+    _sd = None
+    
+    # One row per input device, so callers can filter with array ops
+    # (e.g. ``devs[devs['default_rate'] >= 16000]``)
+    DEVICE_DTYPE = np.dtype([
+        ('index', 'i4'), ('name', 'U64'), ('max_in', 'i4'), ('default_rate', 'f4'),
+    ])
+    # Seconds a device listing is reused before PortAudio is queried again
+    DEVICE_CACHE_TTL = 5.0
+    _devices = None
+    _devices_time = 0.0
+    
     def __init__(self, 
                  sample_rate: int = 16000,
                  channels: int = 1,
                  max_duration: int = 30,
-                 device: str = 'default'):
+                 device: str = 'default',
+                 dtype: str = 'float32'):
         """Initialize audio capture.
         
         Args:
@@ -26,31 +40,93 @@ class AudioCapture:
             channels: Number of audio channels
             max_duration: Maximum recording duration in seconds
             device: Audio device name or index
+            dtype: Sample format, 'float32' or 'int16' (half the memory)
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.max_duration = max_duration
         self.device = device
+        if dtype not in ('float32', 'int16'):
+            raise ValueError(f"Unsupported audio format: {dtype}")
+        self.dtype = np.dtype(dtype)
+        # 100ms blocks
+        self._block = max(1, sample_rate // 10)
         
         self._recording = False
-        self._audio_data = []
+        self._buf = None
+        self._pos = 0
+        self._overflow_count = 0
+        self._start_time = 0.0
         self._stream = None
         
-        # Try to import audio library (will be installed later)
-        try:
-            import sounddevice as sd
-            self.sd = sd
-            self.available = True
-            log_audio_event("Audio capture initialized", {
-                "device": device, 
-                "sample_rate": sample_rate, 
-                "channels": channels,
-                "max_duration": max_duration
-            })
-        except ImportError as e:
-            log_malfunction("AudioCapture", f"sounddevice not available: {e}", "ERROR")
-            logger.error("🚨 Audio capture disabled - sounddevice not installed")
-            self.available = False
+        # sounddevice (PortAudio + device enumeration) is imported on first
+        # use of ``available``, not at construction
+        self.sd = None
+        self._available = None
+        
+        log_audio_event("Audio capture initialized", {
+            "device": device, 
+            "sample_rate": sample_rate, 
+            "channels": channels,
+            "max_duration": max_duration
+        })
+    
+    @classmethod
+    def _load_sd(cls):
+        """Import sounddevice once per process.
+        
+        Returns:
+            The sounddevice module
+        """
+        if cls._sd is None:
+            import sounddevice
+            cls._sd = sounddevice
+        return cls._sd
+    
+    @property
+    def available(self) -> bool:
+        """Whether sounddevice can be used; imports it on first access."""
+        if self._available is None:
+            try:
+                self.sd = self._load_sd()
+                self._available = True
+            except ImportError as e:
+                log_malfunction("AudioCapture", f"sounddevice not available: {e}", "ERROR")
+                logger.error("🚨 Audio capture disabled - sounddevice not installed")
+                self._available = False
+        return self._available
+    
+    @classmethod
+    def list_input_devices(cls) -> np.ndarray:
+        """List audio input devices.
+        
+        The listing is cached for ``DEVICE_CACHE_TTL`` seconds, as querying
+        PortAudio enumerates every host API.
+        
+        Returns:
+            Structured array with ``DEVICE_DTYPE`` fields, one row per
+            device that has input channels
+        """
+        now = time.monotonic()
+        if cls._devices is None or now - cls._devices_time >= cls.DEVICE_CACHE_TTL:
+            devices = [
+                (i, d['name'][:64], d['max_input_channels'], d['default_samplerate'])
+                for i, d in enumerate(cls._load_sd().query_devices())
+                if d['max_input_channels'] > 0
+            ]
+            cls._devices = np.array(devices, dtype=cls.DEVICE_DTYPE)
+            cls._devices_time = now
+        return cls._devices
+    
+    @classmethod
+    def list_input_devices_dicts(cls) -> List[dict]:
+        """List audio input devices as one dict per device.
+        
+        Returns:
+            Dicts with the ``DEVICE_DTYPE`` field names as keys
+        """
+        names = cls.DEVICE_DTYPE.names
+        return [dict(zip(names, row)) for row in cls.list_input_devices().tolist()]
     
     def start_recording(self) -> None:
         """Start recording audio."""
@@ -62,19 +138,37 @@ class AudioCapture:
             log_malfunction("AudioCapture", "Attempted to start recording while already recording", "WARNING")
             return
         
+        # Preallocate the whole recording so chunks are written in place
+        max_samples = int(self.sample_rate * self.max_duration)
+        self._buf = np.empty((max_samples, self.channels), dtype=self.dtype)
+        self._pos = 0
+        self._overflow_count = 0
+        
         self._recording = True
-        self._audio_data = []
         self._start_time = time.time()
         
-        log_audio_event("Recording started", {
+        log_audio_event("Recording started", lambda: {
             "max_duration": self.max_duration,
             "sample_rate": self.sample_rate,
             "device": self.device
         })
         
-        # Start recording in separate thread
-        self._record_thread = threading.Thread(target=self._record)
-        self._record_thread.start()
+        # PortAudio delivers 100ms blocks to _callback on its own thread
+        try:
+            self._stream = self.sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype=self.dtype.name,
+                device=self.device if self.device != 'default' else None,
+                blocksize=self._block,
+                callback=self._callback
+            )
+            self._stream.start()
+        except Exception as e:
+            self._recording = False
+            self._stream = None
+            logger.error("Error starting recording: {}", e)
+            raise
     
     def stop_recording(self) -> np.ndarray:
         """Stop recording and return audio data.
@@ -84,61 +178,56 @@ class AudioCapture:
         """
         if not self._recording:
             log_malfunction("AudioCapture", "Attempted to stop recording when not recording", "WARNING")
-            return np.array([], dtype=np.float32)
+            return np.array([], dtype=self.dtype)
         
         self._recording = False
         
-        if self._record_thread:
-            self._record_thread.join(timeout=1.0)
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception as e:
+                logger.error("Error closing audio stream: {}", e)
+            self._stream = None
         
         # Calculate metrics
-        duration = time.time() - self._start_time if hasattr(self, '_start_time') else 0
-        samples_count = len(self._audio_data)
+        duration = time.time() - self._start_time
+        samples_count = self._pos
         
-        log_audio_event("Recording stopped", {
+        log_audio_event("Recording stopped", lambda: {
             "duration": f"{duration:.2f}s",
-            "data_chunks": samples_count,
-            "audio_quality": "good" if samples_count > 10 else "poor"
+            "samples": samples_count,
+            "audio_quality": "good" if samples_count > self.sample_rate else "poor"
         })
         
         log_performance("Audio recording", duration, threshold=self.max_duration * 0.8)
         
-        if self._audio_data:
-            audio_array = np.concatenate(self._audio_data)
-            logger.info(f"✅ Audio capture successful: {len(audio_array)} samples in {duration:.2f}s")
+        if self._overflow_count:
+            log_malfunction("AudioCapture", f"{self._overflow_count} audio buffer overflow(s) during recording", "WARNING")
+        
+        if samples_count:
+            audio_array = self._buf[:samples_count]
+            logger.info("✅ Audio capture successful: {} samples in {:.2f}s", len(audio_array), duration)
             return audio_array
         else:
             log_malfunction("AudioCapture", "No audio data captured during session", "WARNING")
-            return np.array([], dtype=np.float32)
+            return np.array([], dtype=self.dtype)
     
-    def _record(self) -> None:
-        """Internal recording loop."""
-        try:
-            max_samples = int(self.sample_rate * self.max_duration)
-            samples_recorded = 0
-            
-            with self.sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype='float32',
-                device=self.device if self.device != 'default' else None
-            ) as stream:
-                while self._recording and samples_recorded < max_samples:
-                    data, overflowed = stream.read(self.sample_rate // 10)  # 100ms chunks
-                    
-                    if overflowed:
-                        logger.warning("Audio buffer overflow")
-                    
-                    self._audio_data.append(data.copy())
-                    samples_recorded += len(data)
-                    
-            if samples_recorded >= max_samples:
-                logger.info("Maximum recording duration reached")
-                self._recording = False
-                
-        except Exception as e:
-            logger.error(f"Error during recording: {e}")
-            self._recording = False
+    def _callback(self, indata, frames, time_info, status) -> None:
+        """Copy one block from PortAudio into the recording buffer."""
+        if status:
+            # Input over/underflow; counted here and reported once on stop
+            self._overflow_count += 1
+        
+        pos = self._pos
+        n = min(frames, len(self._buf) - pos)
+        self._buf[pos:pos + n] = indata[:n]
+        self._pos = pos + n
+        
+        if self._pos >= len(self._buf):
+            # Recording stays "on" so the next stop_recording() returns it
+            logger.info("Maximum recording duration reached")
+            raise self.sd.CallbackStop
     
     def is_recording(self) -> bool:
         """Check if currently recording.
@@ -165,41 +254,50 @@ class AudioCapture:
         
         logger.info("Recording until silence detected...")
         
-        audio_data = []
+        max_samples = int(self.sample_rate * self.max_duration)
+        buf = np.empty((max_samples, self.channels), dtype=self.dtype)
+        pos = 0
         silence_samples = int(self.sample_rate * silence_duration)
         consecutive_silence = 0
+        # Compare sum of squares against threshold^2 * n instead of taking
+        # sqrt(mean(x**2)) per chunk: no temporary array, no sqrt
+        if self.dtype == np.int16:
+            # Threshold is given for [-1, 1] audio
+            silence_threshold *= 32768
+        threshold_sq = silence_threshold * silence_threshold
         
         try:
             with self.sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
-                dtype='float32',
+                dtype=self.dtype.name,
                 device=self.device if self.device != 'default' else None
             ) as stream:
                 
                 while consecutive_silence < silence_samples:
-                    data, _ = stream.read(self.sample_rate // 10)  # 100ms chunks
-                    audio_data.append(data.copy())
-                    
-                    # Calculate RMS
-                    rms = np.sqrt(np.mean(data**2))
+                    # 100ms chunks, clipped so the last read fits the buffer
+                    frames = min(self._block, max_samples - pos)
+                    data, _ = stream.read(frames)
+                    n = len(data)
+                    buf[pos:pos + n] = data
+                    pos += n
                     
-                    if rms < silence_threshold:
-                        consecutive_silence += len(data)
-                    else:
-                        consecutive_silence = 0
+                    flat = data.reshape(-1)
+                    silent = chunk_energy(flat) < threshold_sq * flat.size
+                    # Grow the silent run, or reset it to 0 on a loud chunk
+                    consecutive_silence = (consecutive_silence + n) * silent
                     
                     # Safety check for max duration
-                    if len(audio_data) * len(data) >= self.sample_rate * self.max_duration:
+                    if pos >= max_samples:
                         logger.info("Maximum duration reached")
                         break
         
         except Exception as e:
-            logger.error(f"Error during silence detection: {e}")
+            logger.error("Error during silence detection: {}", e)
         
-        logger.info(f"Silence detected, captured {len(audio_data)} chunks")
+        logger.info("Silence detected, captured {} samples", pos)
         
-        if audio_data:
-            return np.concatenate(audio_data)
+        if pos:
+            return buf[:pos]
         else:
-            return np.array([], dtype=np.float32)
+            return np.array([], dtype=self.dtype)
@@ -0,0 +1,24 @@
+"""Optional input/output backend libraries, imported once on first use."""
+
+import functools
+import importlib
+
+
+@functools.lru_cache(maxsize=None)
+def optional_import(name: str):
+    """Import an optional backend module once and share it.
+    
+    Imports stay lazy (pynput, for example, connects to the display when
+    imported), but every handler after the first reuses the cached result,
+    including a failed import.
+    
+    Args:
+        name: Absolute module name (e.g. 'pynput.keyboard')
+        
+    Returns:
+        The module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -0,0 +1,176 @@
+"""Small signal-processing kernels used on the audio path.
+
+Kernels are compiled with numba when it is installed; otherwise the NumPy
+implementation is used. Both take a 1-D sample array.
+
+The numba kernels are declared with explicit signatures for the sample
+types the service records (float32 and int16), so they are compiled (or
+loaded from numba's on-disk cache) when this module is imported instead
+of on the first hotkey press.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    from numba import types as nbt
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    def _input_arrays(dtype) -> list:
+        """1-D numba array types a kernel accepts for ``dtype`` samples.
+
+        Contiguous and strided, writable and read-only (``np.frombuffer`` over
+        ``bytes``) arrays each need their own compiled specialization.
+        """
+        return [nbt.Array(dtype, 1, layout, readonly=readonly)
+                for layout in ('C', 'A') for readonly in (False, True)]
+
+
+def _chunk_energy_numpy(x: np.ndarray) -> float:
+    """Return the sum of squared samples of a 1-D array."""
+    if x.dtype.kind == 'i':
+        # An integer dot product would overflow in the input type
+        x = x.astype(np.float32)
+    return float(np.dot(x, x))
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit([nbt.float64(a) for t in (nbt.float32, nbt.int16) for a in _input_arrays(t)],
+                cache=True, fastmath=True, boundscheck=False)
+    def _chunk_energy_numba(x):
+        s = np.float32(0.0)
+        for v in x:
+            s += v * v
+        return s
+
+    # Sample types _chunk_energy_numba is compiled for
+    _COMPILED_TYPES = (np.float32, np.int16)
+
+    def chunk_energy(x: np.ndarray) -> float:
+        """Return the sum of squared samples of a 1-D array.
+
+        Args:
+            x: 1-D sample array
+
+        Returns:
+            Sum of ``x[i] ** 2``
+        """
+        if x.dtype.type not in _COMPILED_TYPES:
+            return _chunk_energy_numpy(x)
+        return float(_chunk_energy_numba(x))
+else:
+    chunk_energy = _chunk_energy_numpy
+
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _int16_to_float32_numpy(x: np.ndarray, out: np.ndarray) -> None:
+    # Cast, then scale in place: faster than a mixed-type multiply, which
+    # goes through NumPy's buffered casting loop
+    np.copyto(out, x, casting='unsafe')
+    np.multiply(out, _INT16_SCALE, out=out)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit([nbt.void(a, nbt.float32[::1]) for a in _input_arrays(nbt.int16)],
+                cache=True, fastmath=True, boundscheck=False)
+    def _int16_to_float32_numba(x, out):
+        for i in range(x.shape[0]):
+            out[i] = x[i] * np.float32(1.0 / 32768.0)
+
+
+def int16_to_float32(x: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Convert int16 samples to float32 in [-1, 1).
+    
+    With numba, 1-D input is cast and scaled in a single fused pass.
+    
+    Args:
+        x: int16 sample array
+        out: Optional float32 array of the same shape to write into
+        
+    Returns:
+        float32 array of the same shape (``out`` if given)
+    """
+    if out is None:
+        out = np.empty(x.shape, dtype=np.float32)
+    if (NUMBA_AVAILABLE and x.ndim == 1 and x.dtype == np.int16
+            and out.flags.c_contiguous):
+        _int16_to_float32_numba(x, out)
+    else:
+        _int16_to_float32_numpy(x, out)
+    return out
+
+
+def _trim_silence_numpy(x: np.ndarray, threshold: float, hop: int) -> tuple:
+    n = len(x)
+    if n == 0:
+        return 0, 0
+    starts = np.arange(0, n, hop)
+    x = x.astype(np.float64)
+    energy = np.add.reduceat(x * x, starts)
+    lengths = np.diff(np.append(starts, n))
+    voiced = np.flatnonzero(energy > threshold * threshold * lengths)
+    if not voiced.size:
+        return 0, 0
+    return int(starts[voiced[0]]), int(min(starts[voiced[-1]] + hop, n))
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit([nbt.UniTuple(nbt.intp, 2)(a, nbt.float64, nbt.intp)
+                 for a in _input_arrays(nbt.float32)],
+                cache=True, fastmath=True, boundscheck=False)
+    def _trim_silence_numba(x, threshold, hop):
+        n = x.shape[0]
+        limit = threshold * threshold
+        # Scan forward to the first voiced frame...
+        start = n
+        for f0 in range(0, n, hop):
+            f1 = min(f0 + hop, n)
+            s = 0.0
+            for i in range(f0, f1):
+                s += x[i] * x[i]
+            if s > limit * (f1 - f0):
+                start = f0
+                break
+        if start == n:
+            return 0, 0
+        # ...and backward to the last one, on the same frame grid, so the
+        # speech in between is never read
+        f0 = (n - 1) // hop * hop
+        while f0 > start:
+            f1 = min(f0 + hop, n)
+            s = 0.0
+            for i in range(f0, f1):
+                s += x[i] * x[i]
+            if s > limit * (f1 - f0):
+                break
+            f0 -= hop
+        return start, min(f0 + hop, n)
+
+
+def trim_silence(x: np.ndarray, threshold: float, hop: int = 512) -> tuple:
+    """Find the span of ``x`` between the first and last non-silent frame.
+    
+    ``x`` is cut into ``hop``-sample frames; a frame is silent when its RMS
+    is at most ``threshold``. With numba, only the leading and trailing
+    silence is scanned.
+    
+    Args:
+        x: 1-D sample array
+        threshold: RMS level, in sample units, at or below which a frame
+            is silent
+        hop: Frame length in samples
+        
+    Returns:
+        ``(start, end)`` sample indices, so ``x[start:end]`` is the trimmed
+        audio; ``(0, 0)`` if every frame is silent
+    """
+    if NUMBA_AVAILABLE and x.ndim == 1 and x.dtype == np.float32:
+        start, end = _trim_silence_numba(x, float(threshold), hop)
+        return int(start), int(end)
+    return _trim_silence_numpy(x, threshold, hop)
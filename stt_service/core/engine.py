@@ -1,19 +1,149 @@
 """STT Engine interface for model abstraction."""
 
+import asyncio
+import contextlib
+import functools
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import numpy as np
+import threading
 import time
 import random
 
+from .dsp import int16_to_float32, trim_silence
 from .logger import get_logger, log_operation_start, log_operation_success, log_stt_event, log_malfunction, log_performance, log_audio_event
 
 logger = get_logger(__name__)
 
+# Sample rate the engines assume for duration estimates (Whisper uses 16kHz)
+SAMPLE_RATE = 16000
+_INV_SAMPLE_RATE = 1.0 / SAMPLE_RATE
+
+# Longest clip passed to Whisper (10 seconds)
+MAX_SAMPLES = SAMPLE_RATE * 10
+
+# Peak level (about -60 dBFS) below which audio is treated as silence and
+# not sent to the model at all
+SILENCE_PEAK = 1e-3
+
+# Frame length (32 ms) for trimming silence around the speech; one frame of
+# margin is kept on each side so soft onsets are not clipped
+TRIM_HOP = 512
+
+# STT_FAST_DUMMY=1 makes DummyEngine skip its simulated latency, so tests and
+# benchmarks can use it as a zero-cost baseline
+_FAST_DUMMY = os.environ.get("STT_FAST_DUMMY") == "1"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_whisper():
+    """Import openai-whisper (and torch) once, on first model load."""
+    import whisper
+    return whisper
+
+
+@functools.lru_cache(maxsize=1)
+def _get_whisper_model_class():
+    """Import faster-whisper's WhisperModel once, on first model load."""
+    from faster_whisper import WhisperModel
+    return WhisperModel
+
+
+def _coerce_audio(audio: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Prepare audio as 1D float32 in a prefix of a reusable buffer.
+    
+    Clips to ``len(out)`` samples, downmixes multi-channel ``(samples,
+    channels)`` input by averaging, and casts into ``out`` in a single pass.
+    The result is C-contiguous, as the model backends expect. int16 input
+    (including raw PCM bytes) is scaled from full scale to [-1, 1).
+    
+    Args:
+        audio: 1D or 2D audio array of any numeric dtype, or raw int16 PCM
+            as bytes/bytearray/memoryview
+        out: float32 buffer to write into
+        
+    Returns:
+        View of ``out`` holding the prepared samples
+    """
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        audio = np.frombuffer(audio, dtype=np.int16)  # view, no copy
+    
+    if audio.ndim not in (1, 2):
+        raise ValueError(f"Expected 1D or 2D audio, got shape {audio.shape}")
+    
+    # Clip rows first so later steps never touch discarded samples
+    if len(audio) > len(out):
+        logger.warning("Audio too long ({} samples), truncating to {} samples", len(audio), len(out))
+        audio = audio[:len(out)]
+    
+    buf = out[:len(audio)]
+    if audio.ndim == 2 and audio.shape[1] != 1:
+        np.mean(audio, axis=1, dtype=np.float32, out=buf)
+        if audio.dtype == np.int16:
+            np.multiply(buf, np.float32(1.0 / 32768.0), out=buf)
+        return buf
+    
+    if audio.ndim == 2:
+        audio = audio[:, 0]  # mono (samples, 1): a view
+    if audio.dtype == np.int16:
+        # Fused cast + scale when numba is installed
+        return int16_to_float32(audio, buf)
+    np.copyto(buf, audio, casting='unsafe')
+    return buf
+
+
+def _peak(audio: np.ndarray) -> float:
+    """Return the peak absolute sample value (0.0 for empty audio)."""
+    return float(np.abs(audio).max()) if audio.size else 0.0
+
+
+def _trim(audio: np.ndarray) -> np.ndarray:
+    """Drop leading and trailing frames whose RMS is below ``SILENCE_PEAK``.
+    
+    Args:
+        audio: 1D float32 audio within [-1, 1]
+        
+    Returns:
+        View of ``audio`` around the speech; empty if there is none
+    """
+    start, end = trim_silence(audio, SILENCE_PEAK, TRIM_HOP)
+    if start == end:
+        return audio[:0]
+    start = max(start - TRIM_HOP, 0)
+    end = min(end + TRIM_HOP, len(audio))
+    if end - start < len(audio):
+        logger.debug("Trimmed silence: kept samples {}-{} of {}", start, end, len(audio))
+    return audio[start:end]
+
+
+def _normalize_inplace(audio: np.ndarray) -> float:
+    """Scale float32 audio into [-1, 1] in place if it exceeds that range.
+    
+    Args:
+        audio: Writable float32 audio array
+        
+    Returns:
+        Peak absolute value before scaling (0.0 for empty audio)
+    """
+    peak = _peak(audio)
+    if peak > 1.0:
+        np.multiply(audio, 1.0 / peak, out=audio)
+    return peak
+
 
 class STTEngine(ABC):
     """Abstract base class for STT engines."""
     
+    # Created on first transcribe_async() call
+    _executor: Optional[ThreadPoolExecutor] = None
+    
+    # True if transcribe() takes a ``normalized`` keyword: a hint that the
+    # audio is already within [-1, 1], so the peak-normalization pass can be
+    # skipped. Callers only pass it to engines that set this.
+    accepts_normalized = False
+    
     @abstractmethod
     def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> str:
         """Transcribe audio to text.
@@ -27,6 +157,30 @@ class STTEngine(ABC):
         """
         pass
     
+    async def transcribe_async(self, audio: np.ndarray, language: Optional[str] = None,
+                               normalized: bool = False) -> str:
+        """Transcribe audio without blocking the event loop.
+        
+        Runs ``transcribe`` on the engine's worker thread. The Whisper engines
+        release the GIL during inference, so other coroutines keep running.
+        
+        Args:
+            audio: Audio data as numpy array
+            language: Language code (e.g., 'en', 'es', 'ca')
+            normalized: Passed on to ``transcribe`` if the engine
+                ``accepts_normalized``, dropped otherwise
+            
+        Returns:
+            Transcribed text
+        """
+        if self._executor is None:
+            # One worker: the engines serialize on their own lock anyway
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stt-engine')
+        kwargs = {'normalized': normalized} if self.accepts_normalized else {}
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self.transcribe, audio, language, **kwargs))
+    
     @abstractmethod
     def load_model(self, model_path: str) -> None:
         """Load the STT model.
@@ -36,6 +190,16 @@ class STTEngine(ABC):
         """
         pass
     
+    def warmup(self) -> None:
+        """Run one throwaway inference so the first real request is fast.
+        
+        Engines without a first-call cost (kernel compilation, CUDA handle
+        creation) keep this no-op. Engines that do warm up should do it once
+        per loaded model, as a cached engine is warmed by every service
+        that gets it from ``create_engine``.
+        """
+        pass
+    
     @abstractmethod
     def is_ready(self) -> bool:
         """Check if engine is ready to transcribe.
@@ -44,6 +208,17 @@ class STTEngine(ABC):
             True if model is loaded and ready
         """
         pass
+    
+    def close(self) -> None:
+        """Shut down the worker thread behind ``transcribe_async``.
+        
+        The model stays loaded and the engine usable: a later
+        ``transcribe_async`` starts a new worker. Cached engines are shared,
+        so closing one never unloads it for other callers.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
 
 class DummyEngine(STTEngine):
@@ -65,7 +240,8 @@ class DummyEngine(STTEngine):
         log_operation_start("Load Dummy Model", model_path=model_path)
         
         # Simulate loading time
-        time.sleep(0.1)
+        if not _FAST_DUMMY:
+            time.sleep(0.1)
         
         self.ready = True
         duration = time.time() - start_time
@@ -92,7 +268,7 @@ class DummyEngine(STTEngine):
         
         # Analyze audio for realistic dummy response
         audio_length = len(audio) if audio is not None else 0
-        duration = audio_length / 16000.0  # Assume 16kHz
+        duration = audio_length * _INV_SAMPLE_RATE
         lang_text = language or 'unknown'
         
         log_audio_event("Transcription request", {
@@ -111,11 +287,13 @@ class DummyEngine(STTEngine):
             result = f"[Dummy {lang_text}]: Long speech detected, duration: {duration:.1f}s"
         
         # Simulate processing time
-        processing_time = min(0.5, duration * 0.2)  # Realistic processing time
-        time.sleep(processing_time)
+        if not _FAST_DUMMY:
+            processing_time = min(0.5, duration * 0.2)  # Realistic processing time
+            time.sleep(processing_time)
         
         total_time = time.time() - start_time
-        confidence = random.uniform(0.8, 0.95)  # Fake confidence score
+        # Fake confidence score
+        confidence = 0.9 if _FAST_DUMMY else random.uniform(0.8, 0.95)
         
         log_stt_event("Transcription completed", 
                       text=result, 
@@ -139,9 +317,22 @@ class DummyEngine(STTEngine):
 class WhisperEngine(STTEngine):
     """OpenAI Whisper STT engine (requires openai-whisper package)."""
     
+    accepts_normalized = True
+    
     def __init__(self):
         self.model = None
         self.ready = False
+        # Reused float32 buffer for cast + normalize; the lock also covers
+        # the model call, which reads from it
+        self._scratch = np.empty(MAX_SAMPLES, dtype=np.float32)
+        self._lock = threading.Lock()
+        # Replaced by torch.inference_mode once the model is loaded
+        self._inference_mode = contextlib.nullcontext
+        # Half precision only when the model landed on a GPU
+        self._fp16 = False
+        # Set by warmup(); a cached engine handed to a second service is
+        # already warm
+        self._warm = False
         logger.info("Initialized Whisper STT Engine")
     
     def load_model(self, model_path: str) -> None:
@@ -151,9 +342,19 @@ class WhisperEngine(STTEngine):
             model_path: Model name or path (e.g., 'base', 'small', 'medium')
         """
         try:
-            import whisper
+            whisper = _get_whisper()
             logger.info(f"Loading Whisper model: {model_path}")
             self.model = whisper.load_model(model_path)
+            # whisper imports torch, so this is already loaded. inference_mode
+            # is stricter than no_grad: it also skips view and version
+            # tracking, and its outputs can never be used with autograd
+            import torch
+            self._inference_mode = torch.inference_mode
+            # whisper.load_model picks CUDA when available; FP16 there halves
+            # memory traffic, while on CPU whisper would fall back to FP32
+            # with a warning anyway
+            self._fp16 = self.model.device.type == 'cuda'
+            self._warm = False
             self.ready = True
             logger.info("Whisper model loaded successfully")
         except ImportError:
@@ -163,12 +364,14 @@ class WhisperEngine(STTEngine):
             logger.error(f"Failed to load Whisper model: {e}")
             raise
     
-    def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> str:
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None,
+                   normalized: bool = False) -> str:
         """Transcribe audio using Whisper.
         
         Args:
-            audio: Audio data as float32 numpy array
+            audio: Audio data as a numpy array, or raw int16 PCM bytes
             language: Language code ('en', 'es', 'ca')
+            normalized: True if audio is already within [-1, 1]
             
         Returns:
             Transcribed text
@@ -176,41 +379,47 @@ class WhisperEngine(STTEngine):
         if not self.ready or self.model is None:
             raise RuntimeError("Whisper model not loaded")
         
+        with self._lock:
+            return self._transcribe(audio, language, normalized)
+    
+    def _transcribe(self, audio: np.ndarray, language: Optional[str],
+                    normalized: bool) -> str:
+        """Transcribe using the scratch buffer; caller holds ``_lock``."""
         try:
-            # Add safety checks and debugging
-            logger.info(f"Audio data: shape={audio.shape}, dtype={audio.dtype}, duration={len(audio)/16000:.2f}s")
-            
-            # Safety check: limit audio length to prevent memory issues
-            max_samples = 16000 * 10  # 10 seconds max
-            if len(audio) > max_samples:
-                logger.warning(f"Audio too long ({len(audio)} samples), truncating to 10 seconds")
-                audio = audio[:max_samples]
+            # Whisper expects 1D float32 audio, at most MAX_SAMPLES long
+            audio = _coerce_audio(audio, self._scratch)
+            logger.debug("Audio data: {} samples, duration={:.2f}s", len(audio), len(audio) * _INV_SAMPLE_RATE)
             
-            # Whisper expects float32 audio
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
+            # Normalize audio to [-1, 1] range (in place); the same peak scan
+            # feeds the silence check
+            if normalized:
+                peak = _peak(audio)
+            else:
+                peak = _normalize_inplace(audio)
+                if peak > 1.0:
+                    logger.debug("Audio normalized by factor: {}", peak)
             
-            # Normalize audio to [-1, 1] range
-            if audio.max() > 1.0 or audio.min() < -1.0:
-                max_val = max(abs(audio.max()), abs(audio.min()))
-                audio = audio / max_val
-                logger.info(f"Audio normalized by factor: {max_val}")
+            if peak < SILENCE_PEAK:
+                logger.info("Silent audio (peak {:.5f}), skipping transcription", peak)
+                return ""
             
-            # Additional safety: ensure audio is 1D
-            if len(audio.shape) > 1:
-                audio = audio.flatten()
-                logger.info("Audio flattened to 1D")
+            # Less audio to encode; the model never sees the silence anyway
+            audio = _trim(audio)
+            if not len(audio):
+                logger.info("No frame above the silence level, skipping transcription")
+                return ""
             
             # Transcribe with minimal options to reduce memory usage
             options = {
-                'fp16': False,  # Use fp32 to avoid potential issues
+                'fp16': self._fp16,
                 'verbose': False,  # Reduce memory overhead
             }
             if language:
                 options['language'] = language
             
-            logger.info(f"Starting Whisper transcription with {len(audio)} samples...")
-            result = self.model.transcribe(audio, **options)
+            logger.debug("Starting Whisper transcription with {} samples...", len(audio))
+            with self._inference_mode():
+                result = self.model.transcribe(audio, **options)
             return result['text'].strip()
             
         except Exception as e:
@@ -221,6 +430,21 @@ class WhisperEngine(STTEngine):
                 return "[Memory Error: Audio too long or system low on RAM]"
             return ""
     
+    def warmup(self) -> None:
+        """Run Whisper once on a second of silence."""
+        if not self.ready or self._warm:
+            return
+        start = time.time()
+        try:
+            # Calls the model directly: transcribe() skips silent audio
+            with self._lock, self._inference_mode():
+                self.model.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32),
+                                      fp16=self._fp16, verbose=False)
+            self._warm = True
+            logger.info("Whisper model warmed up in {:.2f}s", time.time() - start)
+        except Exception as e:
+            logger.warning("Whisper warmup failed (non-fatal): {}", e)
+    
     def is_ready(self) -> bool:
         """Check if ready.
         
@@ -233,12 +457,21 @@ class WhisperEngine(STTEngine):
 class FasterWhisperEngine(STTEngine):
     """Faster Whisper STT engine with GPU support (uses ctranslate2)."""
     
+    accepts_normalized = True
+    
     def __init__(self):
         self.model = None
         self.ready = False
         self.model_path = None
         self.device = None
         self.compute_type = None
+        # Reused float32 buffer for cast + normalize; the lock also covers
+        # the model call, which reads from it
+        self._scratch = np.empty(MAX_SAMPLES, dtype=np.float32)
+        self._lock = threading.Lock()
+        # Set by warmup(); a cached engine handed to a second service is
+        # already warm
+        self._warm = False
         logger.info("Initialized Faster Whisper STT Engine (GPU-optimized)")
     
     def load_model(self, model_path: str) -> None:
@@ -248,7 +481,7 @@ class FasterWhisperEngine(STTEngine):
             model_path: Model name or path (e.g., 'tiny', 'base', 'small', 'medium', 'large')
         """
         try:
-            from faster_whisper import WhisperModel
+            WhisperModel = _get_whisper_model_class()
             
             logger.info(f"Loading Faster Whisper model: {model_path}")
             
@@ -264,12 +497,21 @@ class FasterWhisperEngine(STTEngine):
                 logger.info("✅ Faster Whisper model loaded on GPU with CUDA!")
             except Exception as gpu_error:
                 logger.warning(f"GPU loading failed: {gpu_error}")
-                # Fallback to CPU
+                # Fallback to CPU: int8 weights with float32 activations, and
+                # use half the cores for intra-op parallelism (ctranslate2
+                # otherwise defaults to a small fixed thread count)
                 self.device = "cpu"
-                self.compute_type = "int8"
-                self.model = WhisperModel(model_path, device=self.device, compute_type=self.compute_type)
+                self.compute_type = "int8_float32"
+                self.model = WhisperModel(
+                    model_path,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                    num_workers=1
+                )
                 logger.info("✅ Faster Whisper model loaded on CPU (fallback)")
             
+            self._warm = False
             self.ready = True
             
         except ImportError:
@@ -279,12 +521,14 @@ class FasterWhisperEngine(STTEngine):
             logger.error(f"Failed to load Faster Whisper model: {e}")
             raise
     
-    def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> str:
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None,
+                   normalized: bool = False) -> str:
         """Transcribe audio using Faster Whisper.
         
         Args:
-            audio: Audio data as float32 numpy array
+            audio: Audio data as a numpy array, or raw int16 PCM bytes
             language: Language code ('en', 'es', 'ca')
+            normalized: True if audio is already within [-1, 1]
             
         Returns:
             Transcribed text
@@ -292,51 +536,39 @@ class FasterWhisperEngine(STTEngine):
         if not self.ready or self.model is None:
             raise RuntimeError("Faster Whisper model not loaded")
         
+        with self._lock:
+            return self._transcribe(audio, language, normalized)
+    
+    def _transcribe(self, audio: np.ndarray, language: Optional[str],
+                    normalized: bool) -> str:
+        """Transcribe using the scratch buffer; caller holds ``_lock``."""
         try:
-            # Add safety checks (use 16000 as fallback sample rate for duration estimation)
-            estimated_sample_rate = 16000  # Default assumption for duration calculation
-            logger.info(f"Audio data: shape={audio.shape}, dtype={audio.dtype}, duration={len(audio)/estimated_sample_rate:.2f}s")
-            
-            # Convert 2D audio to 1D if needed (faster-whisper expects 1D)
-            if len(audio.shape) == 2:
-                if audio.shape[1] == 1:
-                    # Mono audio: (samples, 1) -> (samples,)
-                    audio = audio.flatten()
-                    logger.info(f"Flattened mono audio to 1D: shape={audio.shape}")
-                else:
-                    # Stereo audio: (samples, 2) -> (samples,) by averaging channels
-                    audio = np.mean(audio, axis=1)
-                    logger.info(f"Converted stereo to mono: shape={audio.shape}")
-            
-            # Safety check: limit audio length to prevent memory issues
-            # Use estimated sample rate for max samples (assume 8-16kHz range)
-            max_samples = estimated_sample_rate * 10  # 10 seconds max
-            if len(audio) > max_samples:
-                logger.warning(f"Audio too long ({len(audio)} samples), truncating to 10 seconds")
-                audio = audio[:max_samples]
-            
-            # Faster-whisper expects float32 audio
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
-            
-            # Additional safety: check memory usage
-            audio_size_mb = audio.nbytes / (1024 * 1024)
-            if audio_size_mb > 50:  # Limit to 50MB
-                logger.error(f"Audio data too large: {audio_size_mb:.1f}MB, max allowed: 50MB")
-                return ""
+            # Faster-whisper expects 1D float32 audio, at most MAX_SAMPLES long
+            audio = _coerce_audio(audio, self._scratch)
+            logger.debug("Audio data: {} samples, duration={:.2f}s", len(audio), len(audio) * _INV_SAMPLE_RATE)
             
             # Validate audio is not empty
             if len(audio) == 0:
                 logger.warning("Empty audio array received")
                 return ""
             
-            # Normalize audio to [-1, 1] range if needed
-            audio_max = np.abs(audio).max()
-            if audio_max > 1.0:
-                audio = audio / audio_max
-                logger.info(f"Audio normalized by factor: {audio_max}")
-            elif audio_max == 0.0:
-                logger.warning("Silent audio detected (all zeros)")
+            # Normalize audio to [-1, 1] range if needed; the same peak scan
+            # feeds the silence check
+            if normalized:
+                audio_max = _peak(audio)
+            else:
+                audio_max = _normalize_inplace(audio)
+                if audio_max > 1.0:
+                    logger.debug("Audio normalized by factor: {}", audio_max)
+            
+            if audio_max < SILENCE_PEAK:
+                logger.info("Silent audio (peak {:.5f}), skipping transcription", audio_max)
+                return ""
+            
+            # Less audio for the VAD and encoder to process
+            audio = _trim(audio)
+            if not len(audio):
+                logger.info("No frame above the silence level, skipping transcription")
                 return ""
             
             # Transcribe using faster-whisper
@@ -345,16 +577,19 @@ class FasterWhisperEngine(STTEngine):
                 language=language,
                 beam_size=1,  # Faster inference
                 best_of=1,    # Faster inference
+                temperature=0.0,  # Greedy only, no temperature fallback passes
+                condition_on_previous_text=False,  # Single short utterance
+                without_timestamps=True,  # Timestamps are not used
                 vad_filter=True,  # Voice activity detection
                 vad_parameters=dict(min_silence_duration_ms=500)
             )
             
             # Combine segments into text
-            text = " ".join([segment.text for segment in segments]).strip()
-            logger.info(f"Faster Whisper transcription completed: '{text}'")
+            text = " ".join(segment.text for segment in segments).strip()
+            logger.debug("Faster Whisper transcription completed: '{}'", text)
             
             # Note: Model stays loaded in GPU memory for better performance
-            # Use unload_model() manually if you need to free GPU memory
+            # (clear_engine_cache() drops cached engines to free it)
             
             return text
             
@@ -374,6 +609,29 @@ class FasterWhisperEngine(STTEngine):
             logger.error(f"Error type: {type(e).__name__}")
             return ""
     
+    def warmup(self) -> None:
+        """Run faster-whisper once on a second of silence."""
+        if not self.ready or self._warm:
+            return
+        start = time.time()
+        try:
+            # Calls the model directly: transcribe() skips silent audio, and
+            # the VAD would drop every segment before the decoder runs
+            with self._lock:
+                segments, _ = self.model.transcribe(
+                    np.zeros(SAMPLE_RATE, dtype=np.float32),
+                    beam_size=1,
+                    without_timestamps=True,
+                    vad_filter=False
+                )
+                # Segments are decoded lazily
+                for _ in segments:
+                    pass
+            self._warm = True
+            logger.info("Faster Whisper model warmed up in {:.2f}s", time.time() - start)
+        except Exception as e:
+            logger.warning("Faster Whisper warmup failed (non-fatal): {}", e)
+    
     def is_ready(self) -> bool:
         """Check if ready.
         
@@ -383,28 +641,68 @@ class FasterWhisperEngine(STTEngine):
         return self.ready
 
 
-def create_engine(engine_type: str = 'faster-whisper', model_path: str = '') -> STTEngine:
-    """Factory function to create STT engines.
+def _build_engine(engine_type: str) -> STTEngine:
+    """Instantiate an (unloaded) engine of the given type.
     
     Args:
         engine_type: Type of engine ('faster-whisper', 'whisper', 'dummy')
-        model_path: Path to model files
         
     Returns:
-        Initialized STT engine
+        New STT engine
     """
-    if engine_type.lower() == 'faster-whisper':
-        engine = FasterWhisperEngine()
-    elif engine_type.lower() == 'whisper':
-        engine = WhisperEngine()
-    elif engine_type.lower() == 'dummy':
-        engine = DummyEngine()
+    if engine_type == 'faster-whisper':
+        return FasterWhisperEngine()
+    elif engine_type == 'whisper':
+        return WhisperEngine()
+    elif engine_type == 'dummy':
+        return DummyEngine()
     else:
         # Default to faster-whisper for unknown types (avoid dummy)
         logger.warning(f"Unknown engine type '{engine_type}', defaulting to faster-whisper")
-        engine = FasterWhisperEngine()
+        return FasterWhisperEngine()
+
+
+# One model at a time: switching models frees the previous one rather than
+# keeping its weights resident
+@functools.lru_cache(maxsize=1)
+def _cached_engine(engine_type: str, model_path: str) -> STTEngine:
+    """Build and load an engine once per (type, model) pair."""
+    engine = _build_engine(engine_type)
+    engine.load_model(model_path)
+    return engine
+
+
+def clear_engine_cache() -> None:
+    """Forget every engine cached by ``create_engine``.
     
-    if model_path:
-        engine.load_model(model_path)
+    The next ``create_engine`` call with a model path builds and loads a
+    fresh engine. A dropped model is freed once no service still holds
+    its engine.
+    """
+    _cached_engine.cache_clear()
+
+
+def create_engine(engine_type: str = 'faster-whisper', model_path: str = '') -> STTEngine:
+    """Factory function to create STT engines.
     
-    return engine
+    Engines created with a model path are cached, so asking again for the
+    same engine type and model returns the already-loaded engine instead of
+    reloading the weights. Without a model path a new, unloaded engine is
+    returned.
+    
+    A cached engine is shared by every caller in the process, including
+    its state. Only the most recently requested engine is cached: asking
+    for another type or model drops it, and its weights are freed once no
+    caller still holds it. Call ``clear_engine_cache()`` to get an engine
+    with fresh state.
+    
+    Args:
+        engine_type: Type of engine ('faster-whisper', 'whisper', 'dummy')
+        model_path: Path to model files
+        
+    Returns:
+        Initialized STT engine
+    """
+    if model_path:
+        return _cached_engine(engine_type.lower(), model_path)
+    return _build_engine(engine_type.lower())
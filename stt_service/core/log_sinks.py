@@ -0,0 +1,312 @@
+"""
+Loguru sinks that keep console and file I/O off the logging thread.
+
+Loguru's ``enqueue=True`` pickles every record and pushes it through a
+multiprocessing pipe, although the service runs in a single process.
+``QueuedSink`` instead hands the already formatted line to an in-process
+queue drained by a daemon thread, which owns the real destination.
+"""
+
+import functools
+import os
+import queue
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional, TextIO
+
+# Queue marker telling the writer thread to exit
+_STOP = object()
+
+
+# Extended attribute holding a log file's creation time where the platform
+# has no birth time (Linux). Same name as loguru's, so files it created
+# keep their age
+_CRTIME_XATTR = "user.loguru_crtime"
+
+
+def _creation_time(path: Path) -> float:
+    """Return when the log file at ``path`` was created.
+    
+    Uses the birth time where the platform has one, else the time recorded
+    in ``_CRTIME_XATTR``. A file with neither is dated by its last write
+    (as loguru does), which is then recorded so the age no longer moves.
+    
+    Raises:
+        FileNotFoundError: If ``path`` does not exist
+    """
+    st = os.stat(path)
+    try:
+        return st.st_birthtime
+    except AttributeError:
+        pass
+    try:
+        return float(os.getxattr(path, _CRTIME_XATTR))
+    except (AttributeError, OSError, ValueError):
+        pass
+    _record_creation_time(path, st.st_mtime)
+    return st.st_mtime
+
+
+def _record_creation_time(path: Path, created: float) -> None:
+    """Store ``created`` in the file's extended attributes, if supported."""
+    try:
+        os.setxattr(path, _CRTIME_XATTR, str(created).encode("ascii"))
+    except (AttributeError, OSError):
+        # No xattrs on this platform or file system: the age falls back to
+        # the last write on the next start
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _compressor() -> ThreadPoolExecutor:
+    """Single worker shared by all writers for compressing rotated files."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+
+class QueuedSink:
+    """Loguru sink that writes messages on a background thread.
+    
+    Register an instance with ``logger.add(sink, ...)``. Loguru calls
+    ``write`` with each formatted message and ``stop`` when the sink is
+    removed (which it also does at interpreter exit), so queued messages
+    are written out before the process ends.
+    """
+    
+    def __init__(self, write: Callable[[str], None], close: Optional[Callable[[], None]] = None,
+                 flush: Optional[Callable[[], None]] = None, flush_interval: float = 0.5,
+                 maxsize: int = 10000, name: str = "log-writer"):
+        """
+        Create the queue and start the writer thread.
+        
+        Args:
+            write: Called on the writer thread with each formatted message
+            close: Called on the writer thread once the queue is drained
+            flush: Called on the writer thread at most ``flush_interval``
+                seconds after a write, for buffered targets
+            flush_interval: Longest time written messages stay unflushed
+            maxsize: Queue capacity; when full, the oldest message is dropped
+            name: Name of the writer thread
+        """
+        self._target = write
+        self._close = close
+        self._flush = flush
+        self._flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self._reported = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    
+    def write(self, message: str) -> None:
+        """Queue a message for the writer thread; never blocks.
+        
+        If the writer has fallen behind and the queue is full, the oldest
+        queued message is discarded so memory stays bounded and the most
+        recent messages survive. Loguru serializes calls to a sink's
+        ``write``, so the queue cannot refill in between.
+        """
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped += 1
+            self._queue.put_nowait(message)
+    
+    def stop(self) -> None:
+        """Write out queued messages and end the writer thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+    
+    def _run(self) -> None:
+        get = self._queue.get
+        target = self._target
+        flush = self._flush
+        interval = self._flush_interval
+        unflushed = False
+        last_flush = time.monotonic()
+        while True:
+            try:
+                # Wait indefinitely only while nothing is left to flush
+                message = get(timeout=interval) if unflushed else get()
+            except queue.Empty:
+                message = None
+            if message is _STOP:
+                break
+            try:
+                if message is not None:
+                    if self.dropped != self._reported:
+                        # One summary line per burst instead of a line per drop
+                        dropped = self.dropped
+                        target(f"[{self._thread.name}] {dropped - self._reported} log messages dropped (queue full)\n")
+                        self._reported = dropped
+                    target(message)
+                    unflushed = flush is not None
+                if unflushed:
+                    now = time.monotonic()
+                    if message is None or now - last_flush >= interval:
+                        flush()
+                        unflushed = False
+                        last_flush = now
+            except Exception as e:
+                # Logging a logging failure through loguru would recurse
+                sys.stderr.write(f"Log writer {self._thread.name} failed: {e}\n")
+        if self._close is not None:
+            self._close()
+
+
+def stream_writer(stream: TextIO) -> Callable[[str], None]:
+    """Return a write function that flushes ``stream`` after each message."""
+    def write(message: str) -> None:
+        stream.write(message)
+        stream.flush()
+    return write
+
+
+class RotatingFileWriter:
+    """Append to a log file, rotating it by size and/or age.
+    
+    Writes go through a 64 KiB buffer, so a burst of log lines costs one
+    ``write`` syscall instead of one per line. The owner flushes it
+    periodically (``QueuedSink(flush=...)``); messages at ``flush_level``
+    or above are flushed immediately so problems reach the disk even if
+    the process dies right after.
+    
+    Rotated files are renamed to ``<stem>.<timestamp><suffix>`` next to the
+    active file, optionally zip-compressed, and pruned by count and/or age.
+    Compression (and the pruning after it) runs on a background worker, so
+    zipping a large file never holds up the messages queued behind it.
+    Not thread-safe: meant to be driven by a single ``QueuedSink`` thread.
+    """
+    
+    def __init__(self, path, max_bytes: Optional[int] = None, interval: Optional[float] = None,
+                 keep: Optional[int] = None, max_age: Optional[float] = None,
+                 compress: bool = False, encoding: str = "utf-8",
+                 buffer_size: int = 64 * 1024, flush_level: int = 30):
+        """
+        Open (or create) the active log file.
+        
+        Args:
+            path: Active log file
+            max_bytes: Rotate before the file would grow past this size
+            interval: Rotate once the file is this many seconds old
+            keep: Number of rotated files to keep
+            max_age: Delete rotated files older than this many seconds
+            compress: Zip rotated files
+            encoding: Text encoding of the log file
+            buffer_size: Write buffer size in bytes
+            flush_level: Numeric level (WARNING is 30) of loguru messages
+                that are flushed as soon as they are written
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.keep = keep
+        self.max_age = max_age
+        self.compress = compress
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._file = None
+        self._pending: Optional[Future] = None
+        self._open()
+    
+    def _open(self) -> None:
+        # The age of an existing file carries over from earlier processes,
+        # so time rotation and retention work across restarts
+        try:
+            created = _creation_time(self.path)
+        except FileNotFoundError:
+            created = None
+        self._file = open(self.path, "ab", buffering=self.buffer_size)
+        if created is None:
+            created = time.time()
+            _record_creation_time(self.path, created)
+        self._size = self._file.tell()
+        self._created = created
+    
+    def write(self, message: str) -> None:
+        """Append a message, rotating first if it is due."""
+        data = message.encode(self.encoding)
+        if self._rotation_due(len(data)):
+            self._rotate()
+        self._file.write(data)
+        self._size += len(data)
+        record = getattr(message, "record", None)
+        if record is not None and record["level"].no >= self.flush_level:
+            self._file.flush()
+    
+    def flush(self) -> None:
+        """Write buffered messages to the file."""
+        if self._file is not None:
+            self._file.flush()
+    
+    def close(self) -> None:
+        """Close the active file and wait for pending compression."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._pending is not None:
+            # The worker runs jobs in order, so the last one finishes last
+            self._pending.result()
+            self._pending = None
+    
+    def _rotation_due(self, incoming: int) -> bool:
+        if self.max_bytes is not None and self._size and self._size + incoming > self.max_bytes:
+            return True
+        return self.interval is not None and time.time() - self._created >= self.interval
+    
+    def _rotate(self) -> None:
+        self._file.close()
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        os.replace(self.path, rotated)
+        self._open()
+        if self.compress:
+            self._pending = _compressor().submit(self._compress_and_prune, rotated)
+        else:
+            self._prune()
+    
+    def _compress_and_prune(self, rotated: Path) -> None:
+        """Background job: zip a rotated file, then apply retention."""
+        try:
+            _zip_and_remove(rotated)
+            self._prune()
+        except Exception as e:
+            sys.stderr.write(f"Log compression of {rotated} failed: {e}\n")
+    
+    def _prune(self) -> None:
+        """Apply the retention policy to rotated files."""
+        if self.keep is None and self.max_age is None:
+            return
+        rotated = []
+        for p in self.path.parent.glob(f"{self.path.stem}.*"):
+            if p != self.path:
+                try:
+                    rotated.append((p.stat().st_mtime, p))
+                except FileNotFoundError:
+                    pass
+        rotated.sort(reverse=True)
+        cutoff = time.time() - self.max_age if self.max_age is not None else None
+        for i, (mtime, p) in enumerate(rotated):
+            if (self.keep is not None and i >= self.keep) or (cutoff is not None and mtime < cutoff):
+                try:
+                    p.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+def _zip_and_remove(path: Path) -> None:
+    """Replace ``path`` with ``path.zip``."""
+    with zipfile.ZipFile(f"{path}.zip", "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.write(path, arcname=path.name)
+    path.unlink()
@@ -5,12 +5,19 @@ This module provides a configured logger with proper rotation settings
 and custom formatting for easy debugging and malfunction detection.
 """
 
+import functools
 import sys
 import os
+import threading
 from pathlib import Path
 from loguru import logger
 from typing import Optional
 
+from .log_sinks import QueuedSink, RotatingFileWriter, stream_writer
+
+_FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}"
+_WEEK = 7 * 24 * 3600
+
 
 class LoggerConfig:
     """Configuration class for STT Service logging."""
@@ -41,59 +48,60 @@ class LoggerConfig:
     def _setup_console_logging(self):
         """Configure console logging with colored output."""
         logger.add(
-            sys.stdout,
+            QueuedSink(stream_writer(sys.stdout), name="log-console"),
             format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
                    "<level>{level: <8}</level> | "
                    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
                    "<level>{message}</level>",
             level="INFO",
             colorize=True,
-            enqueue=True,
         )
     
-    def _setup_file_logging(self):
-        """Configure main log file with rotation."""
-        log_file = self.log_dir / "stt_service.log"
+    def _add_file_sink(self, path: Path, level: str, **rotation):
+        """Add a queued, rotating, zip-compressed file sink.
         
+        Args:
+            path: Log file path
+            level: Minimum level written to the file
+            **rotation: Rotation/retention options for RotatingFileWriter
+        """
+        writer = RotatingFileWriter(path, compress=True, **rotation)
         logger.add(
-            log_file,
-            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}",
+            QueuedSink(writer.write, close=writer.close, flush=writer.flush,
+                       name=f"log-{path.stem}"),
+            format=_FILE_FORMAT,
+            level=level,
+            colorize=False,
+        )
+    
+    def _setup_file_logging(self):
+        """Configure main log file with rotation."""
+        self._add_file_sink(
+            self.log_dir / "stt_service.log",
             level="DEBUG",
-            rotation="1 week",      # Rotate weekly
-            retention="4 weeks",    # Keep 4 weeks of logs
-            compression="zip",      # Compress old logs
-            enqueue=True,
-            serialize=False,
+            interval=_WEEK,         # Rotate weekly
+            max_age=4 * _WEEK,      # Keep 4 weeks of logs
         )
         
         # Additional rotation by size (10MB)
-        logger.add(
+        self._add_file_sink(
             self.log_dir / "stt_service_size.log",
-            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}",
             level="DEBUG",
-            rotation="10 MB",       # Rotate at 10MB
-            retention=10,           # Keep max 10 files
-            compression="zip",
-            enqueue=True,
-            serialize=False,
+            max_bytes=10 * 1024 * 1024,  # Rotate at 10MB
+            keep=10,                     # Keep max 10 files
         )
     
     def _setup_error_logging(self):
         """Configure separate error log file."""
-        error_log = self.log_dir / "stt_service_errors.log"
-        
-        logger.add(
-            error_log,
-            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}",
+        self._add_file_sink(
+            self.log_dir / "stt_service_errors.log",
             level="WARNING",
-            rotation="1 week",
-            retention="4 weeks", 
-            compression="zip",
-            enqueue=True,
-            serialize=False,
+            interval=_WEEK,
+            max_age=4 * _WEEK,
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_logger(name: str):
         """
         Get a logger instance with context.
@@ -109,102 +117,186 @@ class LoggerConfig:
 
 # Global logger configuration
 _logger_config = None
+_setup_lock = threading.Lock()
 
 
 def setup_logging(log_dir: Optional[str] = None) -> None:
     """
     Setup logging configuration for the entire application.
     
+    Called implicitly when the first message is logged, so importing a
+    module (or a short-lived CLI call that logs nothing) creates no log
+    directory, files or writer threads. An explicit call with a
+    ``log_dir`` other than the current one replaces the sinks, so it takes
+    effect even after logging has started.
+    
     Args:
         log_dir: Directory for log files. Defaults to logs/ in project root.
     """
     global _logger_config
+    with _setup_lock:
+        if _logger_config is None or (
+                log_dir is not None and Path(log_dir) != _logger_config.log_dir):
+            _logger_config = LoggerConfig(log_dir)
+
+
+def _setup_on_first_record(record) -> None:
+    """Loguru patcher that sets up logging when the first record arrives.
+    
+    Loguru runs the patcher before handing the record to the sinks, so this
+    first record already goes to the sinks configured here. It stays
+    installed (loguru has no public way to drop a patcher), but after the
+    first record it is a single global check.
+    """
     if _logger_config is None:
-        _logger_config = LoggerConfig(log_dir)
+        setup_logging()
+
 
+logger.configure(patcher=_setup_on_first_record)
 
+
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str = __name__):
     """
     Get a logger instance.
     
+    Bound loggers are cached, so each name is bound only once. Logging
+    itself is set up on the first message, not here.
+    
     Args:
         name: Logger name/context (usually __name__)
         
     Returns:
         Configured logger instance
     """
-    # Ensure logging is setup
-    if _logger_config is None:
-        setup_logging()
-    
     return logger.bind(context=name)
 
 
+# Numeric values of loguru's built-in levels
+_LEVEL_NO = {
+    "TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25,
+    "WARNING": 30, "ERROR": 40, "CRITICAL": 50,
+}
+
+
+def is_enabled(level: str) -> bool:
+    """
+    Check whether any sink would accept a message at the given level.
+    
+    Loguru has no ``isEnabledFor``; this compares against the lowest level
+    of all configured sinks so callers can skip building messages/extras.
+    
+    Args:
+        level: Level name (e.g. "DEBUG")
+        
+    Returns:
+        True if a message at this level would be emitted
+    """
+    return _LEVEL_NO.get(level, 0) >= logger._core.min_level
+
+
+# Level name -> bound logging method, for helpers that take the level as data
+_LOG_DISPATCH = {name: getattr(logger, name.lower()) for name in _LEVEL_NO}
+
+_SEVERITY_EMOJI = {"DEBUG": "🔍", "INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "🚨", "CRITICAL": "💥"}
+
+
 # Additional convenience functions for specific log types
 def log_operation_start(operation: str, **kwargs):
     """Log the start of an operation with context."""
-    logger.info("🚀 Starting operation: {}", operation, extra={"operation": operation, **kwargs})
+    if not is_enabled("INFO"):
+        return
+    logger.info("🚀 Starting operation: {}", operation, operation=operation, **kwargs)
 
 
 def log_operation_success(operation: str, duration: float = None, **kwargs):
     """Log successful completion of an operation."""
+    if not is_enabled("INFO"):
+        return
     if duration is not None:
         logger.info("✅ Operation completed successfully: {} in {:.2f}s", operation, duration,
-                    extra={"operation": operation, "duration": duration, **kwargs})
+                    operation=operation, duration=duration, **kwargs)
     else:
         logger.info("✅ Operation completed successfully: {}", operation,
-                    extra={"operation": operation, **kwargs})
+                    operation=operation, **kwargs)
 
 
 def log_operation_error(operation: str, error: Exception, **kwargs):
     """Log operation error with full context."""
-    logger.error("❌ Operation failed: {} - {}: {}", operation, type(error).__name__, str(error), 
-                 extra={"operation": operation, "error_type": type(error).__name__, 
-                        "error_message": str(error), **kwargs})
+    if not is_enabled("ERROR"):
+        return
+    error_type = type(error).__name__
+    error_message = str(error)
+    logger.error("❌ Operation failed: {} - {}: {}", operation, error_type, error_message,
+                 operation=operation, error_type=error_type, error_message=error_message, **kwargs)
 
 
 def log_malfunction(component: str, issue: str, severity: str = "ERROR", **kwargs):
     """Log system malfunctions with detailed context for easy debugging."""
-    severity_emoji = {"DEBUG": "🔍", "INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "🚨", "CRITICAL": "💥"}
-    emoji = severity_emoji.get(severity.upper(), "🔍")
+    level = severity.upper()
+    log_func = _LOG_DISPATCH.get(level)
+    if log_func is None:
+        # Still report malfunctions logged with a misspelled severity
+        level, log_func = "ERROR", logger.error
+    if not is_enabled(level):
+        return
+    emoji = _SEVERITY_EMOJI.get(level, "🔍")
     
-    log_func = getattr(logger, severity.lower())
     log_func("{} MALFUNCTION DETECTED in {}: {}", emoji, component, issue,
-             extra={"component": component, "malfunction": issue, "severity": severity, **kwargs})
+             component=component, malfunction=issue, severity=severity, **kwargs)
 
 
 def log_performance(operation: str, duration: float, threshold: float = None, **kwargs):
     """Log performance metrics."""
     if threshold and duration > threshold:
-        logger.warning("⏱️ Performance warning: {} took {:.2f}s (threshold: {:.2f}s)", 
-                      operation, duration, threshold,
-                      extra={"operation": operation, "duration": duration, "threshold": threshold, **kwargs})
-    else:
+        if is_enabled("WARNING"):
+            logger.warning("⏱️ Performance warning: {} took {:.2f}s (threshold: {:.2f}s)", 
+                           operation, duration, threshold,
+                           operation=operation, duration=duration, threshold=threshold, **kwargs)
+    elif is_enabled("DEBUG"):
         logger.debug("⏱️ Performance: {} took {:.2f}s", operation, duration,
-                    extra={"operation": operation, "duration": duration, **kwargs})
+                    operation=operation, duration=duration, **kwargs)
 
 
 def log_config_change(key: str, old_value, new_value, **kwargs):
     """Log configuration changes."""
+    if not is_enabled("INFO"):
+        return
     logger.info("🔧 Configuration changed: {} = {} → {}", key, old_value, new_value,
-                extra={"config_key": key, "old_value": old_value, "new_value": new_value, **kwargs})
+                config_key=key, old_value=old_value, new_value=new_value, **kwargs)
 
 
-def log_audio_event(event: str, details: dict = None):
-    """Log audio-related events."""
+def log_audio_event(event: str, details=None):
+    """Log audio-related events.
+    
+    ``details`` may be a dict or a zero-argument callable returning one, so
+    callers can skip building it when INFO is not logged anywhere.
+    """
+    if not is_enabled("INFO"):
+        return
+    if callable(details):
+        details = details()
     if details:
-        logger.info("🎤 Audio event: {} - {}", event, details, extra={"audio_event": event, "details": details})
+        logger.info("🎤 Audio event: {} - {}", event, details, audio_event=event, details=details)
     else:
-        logger.info("🎤 Audio event: {}", event, extra={"audio_event": event})
+        logger.info("🎤 Audio event: {}", event, audio_event=event)
 
 
 def log_stt_event(event: str, text: str = None, confidence: float = None, **kwargs):
     """Log speech-to-text events."""
-    text_preview = text[:50] + "..." if text and len(text) > 50 else text if text else ""
+    if not is_enabled("INFO"):
+        return
+    # Only long text is sliced; short and empty text is logged as is
+    if not text:
+        text_preview = ""
+    elif len(text) > 50:
+        text_preview = text[:50] + "..."
+    else:
+        text_preview = text
     
     if confidence is not None:
         logger.info("🗣️ STT event: {} (confidence: {:.2f}) - '{}'", event, confidence, text_preview,
-                    extra={"stt_event": event, "text": text, "confidence": confidence, **kwargs})
+                    stt_event=event, text=text, confidence=confidence, **kwargs)
     else:
         logger.info("🗣️ STT event: {} - '{}'", event, text_preview,
-                    extra={"stt_event": event, "text": text, **kwargs})
\ No newline at end of file
+                    stt_event=event, text=text, **kwargs)
\ No newline at end of file
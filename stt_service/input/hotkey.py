@@ -2,10 +2,19 @@
 
 from typing import Callable, Optional
 from .base import InputHandler
+from ..core.backends import optional_import
 from ..core.logger import get_logger, log_operation_start, log_operation_success, log_malfunction
 
 logger = get_logger(__name__)
 
+# Hotkey-string names of special keys -> pynput ``Key`` attributes
+_PYNPUT_KEY_NAMES = {
+    'ctrl': 'ctrl_l',
+    'shift': 'shift_l',
+    'alt': 'alt_l',
+    'space': 'space',
+}
+
 
 class HotkeyHandler(InputHandler):
     """Handle hotkey detection for triggering STT."""
@@ -22,13 +31,10 @@ class HotkeyHandler(InputHandler):
         self._keyboard = None
         
         # Try to import keyboard library
-        try:
-            import keyboard
-            self.keyboard_lib = keyboard
-            self.available = True
-        except ImportError:
+        self.keyboard_lib = optional_import('keyboard')
+        self.available = self.keyboard_lib is not None
+        if not self.available:
             logger.warning("keyboard library not available")
-            self.available = False
     
     def start(self, callback: Callable[[], None]) -> None:
         """Start listening for hotkey.
@@ -49,9 +55,9 @@ class HotkeyHandler(InputHandler):
         # Register hotkey
         try:
             self.keyboard_lib.add_hotkey(self.hotkey, self._on_hotkey_pressed)
-            logger.info(f"Hotkey handler started: {self.hotkey}")
+            logger.info("Hotkey handler started: {}", self.hotkey)
         except Exception as e:
-            logger.error(f"Failed to register hotkey: {e}")
+            logger.error("Failed to register hotkey: {}", e)
             self._active = False
             raise
     
@@ -64,7 +70,7 @@ class HotkeyHandler(InputHandler):
             self.keyboard_lib.remove_hotkey(self.hotkey)
             logger.info("Hotkey handler stopped")
         except Exception as e:
-            logger.error(f"Error stopping hotkey handler: {e}")
+            logger.error("Error stopping hotkey handler: {}", e)
         
         self._active = False
         self._callback = None
@@ -79,12 +85,12 @@ class HotkeyHandler(InputHandler):
     
     def _on_hotkey_pressed(self) -> None:
         """Internal callback for hotkey press."""
-        logger.debug(f"Hotkey pressed: {self.hotkey}")
+        logger.debug("Hotkey pressed: {}", self.hotkey)
         if self._callback:
             try:
                 self._callback()
             except Exception as e:
-                logger.error(f"Error in hotkey callback: {e}")
+                logger.error("Error in hotkey callback: {}", e)
 
 
 class PynputHotkeyHandler(InputHandler):
@@ -97,18 +103,17 @@ class PynputHotkeyHandler(InputHandler):
             hotkey: Hotkey combination
         """
         self.hotkey = hotkey
+        # GlobalHotKeys format ('<ctrl>+<shift>+<space>'), built once
+        self._hotkey_spec = f'<{hotkey.replace("+", ">+<")}>'
         self._active = False
         self._callback = None
         self._listener = None
         
         # Try to import pynput
-        try:
-            from pynput import keyboard
-            self.pynput_keyboard = keyboard
-            self.available = True
-        except ImportError:
+        self.pynput_keyboard = optional_import('pynput.keyboard')
+        self.available = self.pynput_keyboard is not None
+        if not self.available:
             logger.warning("pynput library not available")
-            self.available = False
     
     def start(self, callback: Callable[[], None]) -> None:
         """Start listening for hotkey.
@@ -129,16 +134,14 @@ class PynputHotkeyHandler(InputHandler):
         # Parse hotkey string and create global hotkey
         try:
             # Use GlobalHotKeys which we know works
-            hotkey_map = {
-                f'<{self.hotkey.replace("+", ">+<")}>': self._on_hotkey_pressed
-            }
+            hotkey_map = {self._hotkey_spec: self._on_hotkey_pressed}
             
             self._listener = self.pynput_keyboard.GlobalHotKeys(hotkey_map)
             self._listener.start()
-            logger.info(f"Pynput hotkey handler started: {self.hotkey}")
+            logger.info("Pynput hotkey handler started: {}", self.hotkey)
             
         except Exception as e:
-            logger.error(f"Failed to start pynput listener: {e}")
+            logger.error("Failed to start pynput listener: {}", e)
             self._active = False
             raise
     
@@ -175,33 +178,23 @@ class PynputHotkeyHandler(InputHandler):
         Key = self.pynput_keyboard.Key
         KeyCode = self.pynput_keyboard.KeyCode
         
-        parts = hotkey_str.lower().split('+')
         keys = set()
-        
-        for part in parts:
+        for part in hotkey_str.lower().split('+'):
             part = part.strip()
-            if part == 'ctrl':
-                keys.add(Key.ctrl_l)
-            elif part == 'shift':
-                keys.add(Key.shift_l)
-            elif part == 'alt':
-                keys.add(Key.alt_l)
-            elif part == 'space':
-                keys.add(Key.space)
-            else:
-                # Try as character key
-                keys.add(KeyCode.from_char(part))
+            name = _PYNPUT_KEY_NAMES.get(part)
+            # Anything that is not a special key is a character key
+            keys.add(getattr(Key, name) if name else KeyCode.from_char(part))
         
         return keys
     
     def _on_hotkey_pressed(self) -> None:
         """Internal callback for hotkey press."""
-        logger.debug(f"Hotkey pressed: {self.hotkey}")
+        logger.debug("Hotkey pressed: {}", self.hotkey)
         if self._callback:
             try:
                 self._callback()
             except Exception as e:
-                logger.error(f"Error in hotkey callback: {e}")
+                logger.error("Error in hotkey callback: {}", e)
 
 
 def create_hotkey_handler(hotkey: str = 'ctrl+shift+space', 
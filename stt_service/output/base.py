@@ -26,3 +26,11 @@ class OutputHandler(ABC):
             True if output can be used
         """
         pass
+    
+    def close(self) -> None:
+        """Release resources held by the handler (threads, connections).
+        
+        Handlers holding nothing keep this no-op. The handler may still be
+        used afterwards and reacquires what it needs.
+        """
+        pass
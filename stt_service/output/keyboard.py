@@ -1,33 +1,50 @@
 """Keyboard output handler for typing text."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional
 from .base import OutputHandler
+from ..core.backends import optional_import
 from ..core.logger import get_logger, log_operation_start, log_operation_success, log_malfunction, log_performance
 
 logger = get_logger(__name__)
 
+# Longest CompositeHandler.send_text waits for its handlers (seconds)
+SEND_TIMEOUT = 30.0
+
 
 class KeyboardHandler(OutputHandler):
     """Handle keyboard output for typing transcribed text."""
     
-    def __init__(self, delay: float = 0.01):
+    def __init__(self, delay: float = 0.01, pre_type_delay: float = 0.0,
+                 paste_threshold: Optional[int] = None):
         """Initialize keyboard handler.
         
         Args:
             delay: Delay between keystrokes (seconds)
+            pre_type_delay: Wait before typing starts (seconds); the cursor is
+                normally already in place when the hotkey is released
+            paste_threshold: Paste text longer than this many characters via
+                the clipboard and Ctrl+V instead of typing it key by key.
+                None disables pasting (it replaces the clipboard contents and
+                terminals paste with Ctrl+Shift+V)
         """
         self.delay = delay
+        self.pre_type_delay = pre_type_delay
+        self.paste_threshold = paste_threshold
+        self.pyperclip = None
+        if paste_threshold is not None:
+            self.pyperclip = optional_import('pyperclip')
+            if self.pyperclip is None:
+                logger.warning("pyperclip library not available, long text will be typed")
         
         # Try to import keyboard library
-        try:
-            import pynput.keyboard as keyboard
-            self.keyboard = keyboard
-            self.controller = keyboard.Controller()
-            self.available = True
-        except ImportError:
+        self.keyboard = optional_import('pynput.keyboard')
+        self.available = self.keyboard is not None
+        if self.available:
+            self.controller = self.keyboard.Controller()
+        else:
             logger.warning("pynput library not available for keyboard output")
-            self.available = False
     
     def send_text(self, text: str) -> bool:
         """Type the text using keyboard emulation.
@@ -47,11 +64,17 @@ class KeyboardHandler(OutputHandler):
             return True
         
         try:
-            # Small delay to allow user to position cursor
-            time.sleep(0.1)
+            # Optional delay to allow user to position cursor
+            if self.pre_type_delay > 0:
+                time.sleep(self.pre_type_delay)
+            
+            # Long text: one paste instead of a press/release per character
+            if self.pyperclip is not None and len(text) > self.paste_threshold:
+                if self._paste(text):
+                    return True
             
             # Type the text
-            logger.info(f"Typing text: {text[:50]}...")
+            logger.info("Typing text: {}...", text[:50])
             self.controller.type(text)
             
             # Optional: add newline
@@ -61,8 +84,28 @@ class KeyboardHandler(OutputHandler):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to type text: {e}")
+            logger.error("Failed to type text: {}", e)
+            return False
+    
+    def _paste(self, text: str) -> bool:
+        """Put text on the clipboard and press Ctrl+V.
+        
+        Args:
+            text: Text to paste
+            
+        Returns:
+            True if pasted, False if the clipboard could not be set
+        """
+        try:
+            self.pyperclip.copy(text)
+        except Exception as e:
+            logger.warning("Clipboard unavailable, typing instead: {}", e)
             return False
+        logger.info("Pasting text: {}...", text[:50])
+        with self.controller.pressed(self.keyboard.Key.ctrl):
+            self.controller.press('v')
+            self.controller.release('v')
+        return True
     
     def is_available(self) -> bool:
         """Check if keyboard output is available.
@@ -79,13 +122,10 @@ class ClipboardHandler(OutputHandler):
     def __init__(self):
         """Initialize clipboard handler."""
         # Try to import clipboard library
-        try:
-            import pyperclip
-            self.pyperclip = pyperclip
-            self.available = True
-        except ImportError:
+        self.pyperclip = optional_import('pyperclip')
+        self.available = self.pyperclip is not None
+        if not self.available:
             logger.warning("pyperclip library not available for clipboard output")
-            self.available = False
     
     def send_text(self, text: str) -> bool:
         """Copy text to clipboard.
@@ -106,11 +146,11 @@ class ClipboardHandler(OutputHandler):
         
         try:
             self.pyperclip.copy(text)
-            logger.info(f"Copied to clipboard: {text[:50]}...")
+            logger.info("Copied to clipboard: {}...", text[:50])
             return True
             
         except Exception as e:
-            logger.error(f"Failed to copy to clipboard: {e}")
+            logger.error("Failed to copy to clipboard: {}", e)
             return False
     
     def is_available(self) -> bool:
@@ -125,13 +165,22 @@ class ClipboardHandler(OutputHandler):
 class CompositeHandler(OutputHandler):
     """Composite handler that uses multiple output methods."""
     
-    def __init__(self, *handlers: OutputHandler):
+    def __init__(self, *handlers: OutputHandler, timeout: float = SEND_TIMEOUT):
         """Initialize composite handler.
         
         Args:
             handlers: Output handlers to use
+            timeout: Seconds send_text waits for the handlers; a handler
+                still running then is logged and counted as failed
         """
         self.handlers = list(handlers)
+        self.timeout = timeout
+        # Availability is fixed once a handler is constructed (its backend
+        # imported or not), so filter once instead of on every send
+        self._available = [h for h in self.handlers if h.is_available()]
+        # One thread per handler so a slow one (typing) does not delay the
+        # others (clipboard); created on first send, released by close()
+        self._pool = None
     
     def send_text(self, text: str) -> bool:
         """Send text using all handlers.
@@ -140,34 +189,66 @@ class CompositeHandler(OutputHandler):
             text: Text to send
             
         Returns:
-            True if at least one handler succeeded
+            True if at least one handler succeeded in time
         """
         if not self.handlers:
             logger.error("No output handlers configured")
             return False
         
+        available = self._available
+        if len(available) <= 1:
+            return any(h.send_text(text) for h in available)
+        
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=len(available),
+                                            thread_name_prefix='output')
+        # Run the handlers concurrently: total time is the slowest handler,
+        # not the sum
+        futures = {self._pool.submit(h.send_text, text): h for h in available}
+        done, pending = wait(futures, timeout=self.timeout)
+        for future in pending:
+            # The thread cannot be stopped; it finishes (or hangs) on its own
+            log_malfunction("CompositeHandler",
+                            f"{type(futures[future]).__name__} still running after {self.timeout}s",
+                            "WARNING")
+        
         success = False
-        for handler in self.handlers:
-            if handler.is_available():
-                if handler.send_text(text):
+        for future in done:
+            try:
+                if future.result():
                     success = True
+            except Exception as e:
+                logger.error("Output handler failed: {}", e)
         
         return success
     
+    def close(self) -> None:
+        """Shut down the worker threads and close the wrapped handlers."""
+        if self._pool is not None:
+            # Do not wait: a hung handler would block the caller too
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        for handler in self.handlers:
+            handler.close()
+    
     def is_available(self) -> bool:
         """Check if at least one handler is available.
         
         Returns:
             True if available
         """
-        return any(h.is_available() for h in self.handlers)
+        return bool(self._available)
 
 
-def create_output_handler(method: str = 'keyboard') -> OutputHandler:
+def create_output_handler(method: str = 'keyboard', pre_type_delay: float = 0.0,
+                          paste_threshold: Optional[int] = None) -> OutputHandler:
     """Factory function to create output handlers.
     
     Args:
         method: Output method ('keyboard', 'clipboard', or 'both')
+        pre_type_delay: Wait before keyboard typing starts (seconds)
+        paste_threshold: Paste (instead of type) text longer than this;
+            None always types
         
     Returns:
         Output handler instance
@@ -175,11 +256,11 @@ def create_output_handler(method: str = 'keyboard') -> OutputHandler:
     method = method.lower()
     
     if method == 'keyboard':
-        return KeyboardHandler()
+        return KeyboardHandler(pre_type_delay=pre_type_delay, paste_threshold=paste_threshold)
     elif method == 'clipboard':
         return ClipboardHandler()
     elif method == 'both':
-        return CompositeHandler(KeyboardHandler(), ClipboardHandler())
+        return CompositeHandler(KeyboardHandler(pre_type_delay=pre_type_delay, paste_threshold=paste_threshold), ClipboardHandler())
     else:
-        logger.warning(f"Unknown output method '{method}', using keyboard")
-        return KeyboardHandler()
+        logger.warning("Unknown output method '{}', using keyboard", method)
+        return KeyboardHandler(pre_type_delay=pre_type_delay, paste_threshold=paste_threshold)
@@ -1,31 +1,69 @@
 """Main STT service orchestrator."""
 
+import importlib
+import itertools
+import queue
 import time
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple, Union
 import threading
 import numpy as np
 
 from .core.config import Config
-from .core.audio_capture import AudioCapture
-from .core.engine import create_engine, STTEngine
-from .input.hotkey import create_hotkey_handler
-from .output.keyboard import create_output_handler
-from .core.logger import get_logger, log_operation_start, log_operation_success, log_operation_error, log_malfunction, log_stt_event, log_audio_event, log_performance
+from .core.logger import get_logger, log_operation_start, log_operation_success, log_operation_error, log_malfunction, log_stt_event, log_audio_event, log_performance, is_enabled
 
 logger = get_logger(__name__)
 
+# Component classes and factories, imported on first use: the audio and
+# engine modules load numba and compile the DSP kernels, so importing this
+# module stays cheap until a service is built
+_LAZY_IMPORTS = {
+    'AudioCapture': '.core.audio_capture',
+    'create_engine': '.core.engine',
+    'STTEngine': '.core.engine',
+    'create_hotkey_handler': '.input.hotkey',
+    'create_output_handler': '.output.keyboard',
+}
+
+
+def __getattr__(name):
+    """Import a component on first access (``stt_service.service.X``)."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __package__), name)
+    # Later lookups (and mock.patch) find it in the module namespace
+    globals()[name] = value
+    return value
+
+
+def _component(name: str):
+    """Return a lazily imported component, or the mock patched over it."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
 
 class STTService:
     """Main service class that orchestrates all components."""
     
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Union[Config, str, Dict[str, Any], None] = None):
         """Initialize STT service.
         
         Args:
-            config: Configuration object. If None, uses defaults.
+            config: Configuration object, path to a YAML config file, or
+                dict of settings. If None, uses defaults.
         """
+        if isinstance(config, str):
+            config = Config(config)
+        elif isinstance(config, dict):
+            config = Config.from_dict(config)
         self.config = config or Config()
         self.service_start_time = time.time()
+        # Durations use the monotonic clock; service_start_time stays wall clock
+        init_start = time.perf_counter()
+        # Read once: used for every transcription
+        self._language = self.config.get('service.language', 'en')
         
         log_operation_start("STT Service Initialization", 
                            language=self.config.get('service.language'),
@@ -38,13 +76,27 @@ class STTService:
         self.output_handler = None
         
         self._running = False
-        self._processing = False
+        # Set by stop(); run() blocks on it instead of polling _running
+        self._stop_event = threading.Event()
+        # Set once start() has the worker and input handler running, so
+        # callers can wait for a started service instead of polling
+        self._started_event = threading.Event()
+        # Held while a trigger toggles recording; rejects overlapping triggers
+        self._processing = threading.Lock()
+        # Recorded clips waiting for transcription, drained by _worker. A few
+        # slots are plenty: each clip is a hotkey press-and-release
+        self._audio_queue = queue.Queue(maxsize=4)
+        self._worker = None
+        # next() on a count is a single C call, atomic under the GIL;
+        # the *_count attributes hold the latest value for reporting
+        self._transcription_ids = itertools.count(1)
+        self._errors = itertools.count(1)
         self._transcription_count = 0
         self._error_count = 0
         
         try:
             self._initialize_components()
-            init_duration = time.time() - self.service_start_time
+            init_duration = time.perf_counter() - init_start
             log_operation_success("STT Service Initialization", duration=init_duration)
         except Exception as e:
             log_operation_error("STT Service Initialization", e)
@@ -57,30 +109,35 @@ class STTService:
         try:
             # Audio capture
             logger.info("🎤 Initializing audio capture...")
-            self.audio_capture = AudioCapture(
+            self.audio_capture = _component('AudioCapture')(
                 sample_rate=self.config.get('audio.sample_rate', 16000),
                 channels=self.config.get('audio.channels', 1),
                 max_duration=self.config.get('audio.max_duration', 30),
-                device=self.config.get('service.audio_device', 'default')
+                device=self.config.get('service.audio_device', 'default'),
+                dtype=self.config.get('audio.format', 'float32')
             )
             
             # STT Engine
             engine_type = self.config.get('model.type', 'dummy')
             model_path = self.config.get('model.path', '')
-            logger.info(f"🤖 Initializing STT engine: {engine_type}")
-            self.engine = create_engine(engine_type, model_path)
+            logger.info("🤖 Initializing STT engine: {}", engine_type)
+            self.engine = _component('create_engine')(engine_type, model_path)
+            if self.engine.is_ready():
+                self._warmup_engine()
             
             # Input handler
             logger.info("⌨️ Initializing input handler...")
-            self.input_handler = create_hotkey_handler(
+            self.input_handler = _component('create_hotkey_handler')(
                 self.config.get('input.hotkey', 'ctrl+shift+space'),
                 backend='pynput'  # Use pynput to avoid requiring root
             )
             
             # Output handler
             logger.info("🖨 Initializing output handler...")
-            self.output_handler = create_output_handler(
-                method=self.config.get('output.method', 'keyboard')
+            self.output_handler = _component('create_output_handler')(
+                method=self.config.get('output.method', 'keyboard'),
+                pre_type_delay=self.config.get('output.pre_type_delay', 0.0),
+                paste_threshold=self.config.get('output.paste_threshold')
             )
             
             logger.success("✅ All components initialized successfully")
@@ -89,6 +146,11 @@ class STTService:
             log_malfunction("STTService", f"Component initialization failed: {e}", "CRITICAL")
             raise
     
+    def _warmup_engine(self) -> None:
+        """Warm up the loaded engine unless ``model.warmup`` is disabled."""
+        if self.config.get('model.warmup', True):
+            self.engine.warmup()
+    
     def start(self) -> None:
         """Start the STT service."""
         if self._running:
@@ -96,6 +158,7 @@ class STTService:
             return
         
         logger.info("Starting STT Service...")
+        self._stop_event.clear()
         
         # Check if engine is ready
         if not self.engine.is_ready():
@@ -104,17 +167,26 @@ class STTService:
             try:
                 self.engine.load_model(model_path)
             except Exception as e:
-                logger.error(f"Failed to load model: {e}")
+                logger.error("Failed to load model: {}", e)
                 raise
+            self._warmup_engine()
         
         # Start input handler
         try:
             self.input_handler.start(self._on_trigger)
+            # Transcription runs on its own thread so the hotkey listener
+            # (which calls _on_trigger) is never blocked by the model. Started
+            # only now, so a failed start leaves no thread behind; clips
+            # queued by an early press wait for it
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._process_queue, name="stt-worker", daemon=True)
+                self._worker.start()
             self._running = True
+            self._started_event.set()
             logger.info("STT Service started successfully")
-            logger.info(f"Press {self.config.get('input.hotkey')} to start recording")
+            logger.info("Press {} to start recording", self.config.get('input.hotkey'))
         except Exception as e:
-            logger.error(f"Failed to start service: {e}")
+            logger.error("Failed to start service: {}", e)
             raise
     
     def stop(self) -> None:
@@ -133,17 +205,35 @@ class STTService:
         if self.audio_capture and self.audio_capture.is_recording():
             self.audio_capture.stop_recording()
         
+        # Let the worker finish clips already queued, then exit
+        if self._worker is not None:
+            self._audio_queue.put(None)
+            self._worker.join()
+            self._worker = None
+        
+        # After the worker: it is the only user of the output handler
+        if self.output_handler:
+            self.output_handler.close()
+        if self.engine:
+            self.engine.close()
+        
         self._running = False
+        self._started_event.clear()
+        self._stop_event.set()
         logger.info("STT Service stopped")
     
     def _on_trigger(self) -> None:
-        """Handle trigger event (hotkey press)."""
-        if self._processing:
+        """Handle trigger event (hotkey press).
+        
+        Only toggles recording; a finished clip is queued for the worker
+        thread, so this returns in milliseconds and the next hotkey press
+        can start a new recording while the previous one is transcribed.
+        """
+        if not self._processing.acquire(blocking=False):
             log_malfunction("STTService", "Trigger activated while already processing", "WARNING")
             return
         
-        self._processing = True
-        operation_start = time.time()
+        operation_start = time.perf_counter()
         
         try:
             # Toggle recording
@@ -152,7 +242,13 @@ class STTService:
                 audio_data = self.audio_capture.stop_recording()
                 
                 if len(audio_data) > 0:
-                    self._process_audio(audio_data)
+                    # Each recording gets a fresh buffer, so the clip stays
+                    # valid while the next recording runs
+                    try:
+                        self._audio_queue.put_nowait(audio_data)
+                    except queue.Full:
+                        # Never block the hotkey thread behind the model
+                        log_malfunction("STTService", "Transcription backlog full, recording dropped", "WARNING")
                 else:
                     log_malfunction("STTService", "No audio data captured during recording session", "WARNING")
             else:
@@ -160,11 +256,19 @@ class STTService:
                 self.audio_capture.start_recording()
         
         except Exception as e:
-            operation_duration = time.time() - operation_start
+            operation_duration = time.perf_counter() - operation_start
             log_operation_error("Trigger Handling", e, duration=operation_duration)
         
         finally:
-            self._processing = False
+            self._processing.release()
+    
+    def _process_queue(self) -> None:
+        """Worker loop: transcribe and output queued clips until stopped."""
+        while True:
+            audio_data = self._audio_queue.get()
+            if audio_data is None:
+                break
+            self._process_audio(audio_data)
     
     def _process_audio(self, audio_data) -> None:
         """Process captured audio.
@@ -172,47 +276,87 @@ class STTService:
         Args:
             audio_data: Audio data to process
         """
-        start_time = time.time()
-        self._transcription_count += 1
+        start_time = time.perf_counter()
+        transcription_id = self._transcription_count = next(self._transcription_ids)
         
         log_operation_start("Audio Processing", 
                            samples=len(audio_data), 
-                           transcription_id=self._transcription_count)
+                           transcription_id=transcription_id)
         
-        try:
-            # Transcribe
-            language = self.config.get('service.language', 'en')
-            text = self.engine.transcribe(audio_data, language)
+        text, error = self._transcribe_only(audio_data)
+        self._log_result(text, error, transcription_id, start_time)
+    
+    def _transcribe_only(self, audio_data) -> Tuple[Optional[str], Optional[Exception]]:
+        """Run the engine on one clip, without logging or output.
+        
+        Args:
+            audio_data: Audio data to transcribe
             
+        Returns:
+            ``(text, None)`` on success, ``(None, error)`` if the engine raised
+        """
+        try:
+            if self.engine.accepts_normalized:
+                # Captured audio (float32, or int16 which the engines scale
+                # while casting into their own buffer) is in range: skip the
+                # peak scan
+                return self.engine.transcribe(audio_data, self._language, normalized=True), None
+            return self.engine.transcribe(audio_data, self._language), None
+        except Exception as e:
+            return None, e
+    
+    def _log_result(self, text: Optional[str], error: Optional[Exception],
+                    transcription_id: int, start_time: float) -> None:
+        """Send a transcription to the output and log how it went.
+        
+        Args:
+            text: Transcribed text, or None if transcription failed
+            error: Exception raised by the engine, if any
+            transcription_id: Number of this transcription
+            start_time: ``time.perf_counter()`` when processing started
+        """
+        if error is None:
             if text and text.strip():
-                # Log the detected text for proper visibility
-                logger.info(f"🎯 DETECTED TEXT: \"{text}\"")
-                log_stt_event("Transcription success", text=text, transcription_id=self._transcription_count)
-                
-                # Send to output
-                output_start = time.time()
-                if self.output_handler.send_text(text):
-                    output_duration = time.time() - output_start
-                    logger.success(f"✅ Text output successful: '{text[:50]}{'...' if len(text) > 50 else ''}'")
-                    log_performance("Text output", output_duration, threshold=1.0)
-                else:
-                    log_malfunction("STTService", "Failed to send text to output", "ERROR")
-                    self._error_count += 1
+                # Checked once: both calls are skipped when INFO is filtered
+                if is_enabled("INFO"):
+                    # Log the detected text for proper visibility
+                    logger.info("🎯 DETECTED TEXT: \"{}\"", text)
+                    log_stt_event("Transcription success", text=text, transcription_id=transcription_id)
+                try:
+                    self._output_text(text)
+                except Exception as e:
+                    error = e
             else:
                 log_malfunction("STTService", "Empty transcription result", "WARNING")
-                self._error_count += 1
-            
-            processing_duration = time.time() - start_time
+                self._error_count = next(self._errors)
+        
+        processing_duration = time.perf_counter() - start_time
+        if error is not None:
+            self._error_count = next(self._errors)
+            log_operation_error("Audio Processing", error, 
+                              duration=processing_duration,
+                              transcription_id=transcription_id)
+        else:
             log_operation_success("Audio Processing", 
                                 duration=processing_duration,
-                                transcription_id=self._transcription_count)
+                                transcription_id=transcription_id)
+    
+    def _output_text(self, text: str) -> None:
+        """Send text to the output handler, timing the call.
         
-        except Exception as e:
-            processing_duration = time.time() - start_time  
-            self._error_count += 1
-            log_operation_error("Audio Processing", e, 
-                              duration=processing_duration,
-                              transcription_id=self._transcription_count)
+        Args:
+            text: Text to output
+        """
+        output_start = time.perf_counter()
+        if self.output_handler.send_text(text):
+            output_duration = time.perf_counter() - output_start
+            if is_enabled("SUCCESS"):
+                # Skips slicing the preview when SUCCESS is filtered
+                logger.success("✅ Text output successful: '{}{}'", text[:50], '...' if len(text) > 50 else '')
+            log_performance("Text output", output_duration, threshold=1.0)
+        else:
+            log_malfunction("STTService", "Failed to send text to output", "ERROR")
+            self._error_count = next(self._errors)
     
     def _on_speech_input(self, audio_data: np.ndarray) -> None:
         """Handle speech input from audio capture.
@@ -224,7 +368,7 @@ class STTService:
             # Process the audio data
             self._process_audio(audio_data)
         except Exception as e:
-            logger.error(f"Speech input processing failed: {e}")
+            logger.error("Speech input processing failed: {}", e)
             log_malfunction("STTService", f"Speech input failed: {e}", "ERROR")
     
     def run(self) -> None:
@@ -233,8 +377,9 @@ class STTService:
         
         try:
             logger.info("Service running. Press Ctrl+C to stop.")
-            while self._running:
-                time.sleep(0.1)
+            # No timeout: wakes only when stop() is called (Ctrl+C still
+            # interrupts the wait)
+            self._stop_event.wait()
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         finally:
@@ -247,3 +392,12 @@ class STTService:
             True if running
         """
         return self._running
+    
+    def __enter__(self) -> 'STTService':
+        """Start the service for the duration of a ``with`` block."""
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the service when the ``with`` block exits."""
+        self.stop()
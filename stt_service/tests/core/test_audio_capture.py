@@ -134,5 +134,38 @@ class TestAudioCapture(unittest.TestCase):
             capture.start_recording()
 
 
+class TestInputDeviceListing(unittest.TestCase):
+    """Test cases for the cached input device listing."""
+
+    def setUp(self):
+        """Fake sounddevice with one output-only and two input devices."""
+        self.sd = Mock()
+        self.sd.query_devices.return_value = [
+            {'name': 'Device 1', 'max_input_channels': 2, 'default_samplerate': 44100.0},
+            {'name': 'Speakers', 'max_input_channels': 0, 'default_samplerate': 48000.0},
+            {'name': 'Device 2', 'max_input_channels': 1, 'default_samplerate': 16000.0},
+        ]
+        AudioCapture._devices = None
+        self.addCleanup(setattr, AudioCapture, '_devices', None)
+
+    def test_structured_listing(self):
+        """Test input devices are listed as filterable array rows."""
+        with patch.object(AudioCapture, '_load_sd', return_value=self.sd):
+            devices = AudioCapture.list_input_devices()
+        
+        self.assertEqual(list(devices['name']), ['Device 1', 'Device 2'])
+        self.assertEqual(list(devices['index']), [0, 2])
+        self.assertEqual(list(devices[devices['default_rate'] >= 44100]['name']), ['Device 1'])
+
+    def test_listing_is_cached(self):
+        """Test PortAudio is queried once within the cache TTL."""
+        with patch.object(AudioCapture, '_load_sd', return_value=self.sd):
+            AudioCapture.list_input_devices()
+            dicts = AudioCapture.list_input_devices_dicts()
+        
+        self.sd.query_devices.assert_called_once()
+        self.assertEqual(dicts[1], {'index': 2, 'name': 'Device 2', 'max_in': 1, 'default_rate': 16000.0})
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -80,6 +80,20 @@ output:
         config.set('new.nested.key', 'test_value')
         self.assertEqual(config.get('new.nested.key'), 'test_value')
 
+    def test_config_attribute_access(self):
+        """Test attribute access to configuration sections."""
+        config = Config()
+        
+        self.assertEqual(config.audio.sample_rate, 16000)
+        self.assertEqual(config.service.language, 'en')
+        
+        # Attribute view follows set()
+        config.set('audio.sample_rate', 22050)
+        self.assertEqual(config.audio.sample_rate, 22050)
+        
+        with self.assertRaises(AttributeError):
+            config.non_existing_section
+
     def test_config_save_and_load(self):
         """Test saving and loading configuration."""
         config = Config()
@@ -157,6 +171,51 @@ service:
         with self.assertRaises(Exception):
             Config(self.config_file)
 
+    def test_cached_parse_is_not_shared(self):
+        """Test configs loaded from the same file do not share sections."""
+        with open(self.config_file, 'w') as f:
+            f.write("extra:\n  items: [1, 2]\n")
+        
+        first = Config(self.config_file)
+        first.get('extra.items').append(3)
+        second = Config(self.config_file)
+        
+        self.assertEqual(second.get('extra.items'), [1, 2])
+
+    def test_changed_file_is_reparsed(self):
+        """Test editing the file invalidates the cached parse."""
+        with open(self.config_file, 'w') as f:
+            f.write("service:\n  language: es\n")
+        self.assertEqual(Config(self.config_file).get('service.language'), 'es')
+        
+        with open(self.config_file, 'w') as f:
+            f.write("service:\n  language: ca  # edited\n")
+        
+        self.assertEqual(Config(self.config_file).get('service.language'), 'ca')
+
+    def test_non_string_keys(self):
+        """Test YAML keys that are not strings do not break loading."""
+        with open(self.config_file, 'w') as f:
+            f.write("channel_names:\n  1: left\n  2: right\n")
+        
+        config = Config(self.config_file)
+        
+        self.assertEqual(config.get('channel_names.1'), 'left')
+        self.assertEqual(getattr(config.channel_names, '2'), 'right')
+
+    def test_from_dict(self):
+        """Test building a config from a dict merges it over the defaults."""
+        data = {'service': {'language': 'es'}, 'audio': {'channels': 2}}
+        
+        config = Config.from_dict(data)
+        config.set('audio.channels', 1)
+        
+        self.assertEqual(config.get('service.language'), 'es')
+        self.assertEqual(config.get('audio.sample_rate'), 16000)
+        self.assertEqual(config.ns.service.language, 'es')
+        # The caller's dict is copied, not adopted
+        self.assertEqual(data['audio']['channels'], 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
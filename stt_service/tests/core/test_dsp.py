@@ -0,0 +1,129 @@
+"""Tests for dsp module."""
+
+import unittest
+
+import numpy as np
+
+from stt_service.core.dsp import chunk_energy, int16_to_float32, trim_silence, _trim_silence_numpy
+
+
+class TestChunkEnergy(unittest.TestCase):
+    """Test cases for chunk_energy."""
+
+    def test_silence(self):
+        """Test that an all-zero chunk has zero energy."""
+        self.assertEqual(chunk_energy(np.zeros(1600, dtype=np.float32)), 0.0)
+
+    def test_matches_numpy(self):
+        """Test energy against a plain NumPy sum of squares."""
+        rng = np.random.default_rng(0)
+        x = rng.uniform(-1, 1, 1600).astype(np.float32)
+
+        expected = float(np.sum(x.astype(np.float64) ** 2))
+        self.assertAlmostEqual(chunk_energy(x), expected, places=2)
+
+    def test_flattened_2d_chunk(self):
+        """Test a (frames, channels) chunk flattened as AudioCapture does."""
+        x = np.full((1600, 1), 0.5, dtype=np.float32)
+
+        self.assertAlmostEqual(chunk_energy(x.reshape(-1)), 1600 * 0.25, places=3)
+
+    def test_int16_does_not_overflow(self):
+        """Test energy of loud int16 samples is computed without wrap-around."""
+        x = np.full(1600, 20000, dtype=np.int16)
+
+        self.assertEqual(chunk_energy(x), 1600 * 20000.0 ** 2)
+
+    def test_other_dtypes(self):
+        """Test sample types without a compiled kernel are still accepted."""
+        x = np.full(1600, 0.5, dtype=np.float64)
+
+        self.assertAlmostEqual(chunk_energy(x), 1600 * 0.25)
+
+
+class TestInt16ToFloat32(unittest.TestCase):
+    """Test cases for int16_to_float32."""
+
+    def test_scaling(self):
+        """Test int16 full scale maps onto [-1, 1)."""
+        x = np.array([-32768, 0, 16384, 32767], dtype=np.int16)
+
+        out = int16_to_float32(x)
+
+        self.assertEqual(out.dtype, np.float32)
+        np.testing.assert_allclose(out, [-1.0, 0.0, 0.5, 32767 / 32768])
+
+    def test_preserves_shape(self):
+        """Test (frames, channels) input keeps its shape."""
+        x = np.zeros((1600, 1), dtype=np.int16)
+
+        self.assertEqual(int16_to_float32(x).shape, (1600, 1))
+
+    def test_writes_into_out(self):
+        """Test conversion into a caller-provided buffer view."""
+        x = np.array([16384, -16384, 32767], dtype=np.int16)
+        buf = np.zeros(8, dtype=np.float32)
+        
+        out = int16_to_float32(x, buf[:3])
+        
+        np.testing.assert_allclose(buf[:3], [0.5, -0.5, 32767 / 32768])
+        self.assertTrue(np.shares_memory(out, buf))
+        self.assertEqual(buf[3], 0.0)
+
+    def test_strided_input(self):
+        """Test a non-contiguous column view (mono (samples, 1) input)."""
+        x = np.array([[16384, 1], [-32768, 2]], dtype=np.int16)
+        
+        np.testing.assert_allclose(int16_to_float32(x[:, 0]), [0.5, -1.0])
+
+    def test_read_only_input(self):
+        """Test a read-only view over PCM bytes."""
+        x = np.frombuffer(np.array([16384, -16384], dtype=np.int16).tobytes(), dtype=np.int16)
+
+        np.testing.assert_allclose(int16_to_float32(x), [0.5, -0.5])
+
+    def test_strided_out(self):
+        """Test writing into a non-contiguous output view."""
+        x = np.array([16384, -16384], dtype=np.int16)
+        buf = np.zeros(4, dtype=np.float32)
+
+        int16_to_float32(x, buf[::2])
+
+        np.testing.assert_allclose(buf, [0.5, 0.0, -0.5, 0.0])
+
+
+class TestTrimSilence(unittest.TestCase):
+    """Test cases for trim_silence."""
+
+    def test_trims_to_voiced_frames(self):
+        """Test the span covers exactly the frames holding the signal."""
+        x = np.zeros(4096, dtype=np.float32)
+        x[1100:2000] = 0.5
+
+        self.assertEqual(trim_silence(x, 1e-3, 512), (1024, 2048))
+
+    def test_all_silent(self):
+        """Test silent and empty input yield an empty span."""
+        self.assertEqual(trim_silence(np.zeros(4096, dtype=np.float32), 1e-3, 512), (0, 0))
+        self.assertEqual(trim_silence(np.zeros(0, dtype=np.float32), 1e-3, 512), (0, 0))
+
+    def test_partial_last_frame(self):
+        """Test a signal in a trailing partial frame ends at the array end."""
+        x = np.zeros(1000, dtype=np.float32)
+        x[-10:] = 0.5
+
+        self.assertEqual(trim_silence(x, 1e-3, 512), (512, 1000))
+
+    def test_matches_numpy(self):
+        """Test the compiled kernel against the NumPy implementation."""
+        rng = np.random.default_rng(0)
+        for n in (1, 511, 513, 16000):
+            x = np.zeros(n, dtype=np.float32)
+            start = int(rng.integers(0, n))
+            x[start:start + 300] = rng.uniform(-0.5, 0.5, len(x[start:start + 300]))
+
+            self.assertEqual(trim_silence(x, 1e-3, 512), _trim_silence_numpy(x, 1e-3, 512))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,15 @@
 """Tests for STT engine module."""
 
+import asyncio
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import os
 
-from stt_service.core.engine import STTEngine, DummyEngine, create_engine
+import numpy as np
+
+from stt_service.core.engine import STTEngine, DummyEngine, FasterWhisperEngine, create_engine, clear_engine_cache, _coerce_audio, _normalize_inplace, _peak, _trim, SILENCE_PEAK, TRIM_HOP
 
 
 class TestSTTEngine(unittest.TestCase):
@@ -37,6 +41,30 @@ class TestSTTEngine(unittest.TestCase):
         self.assertTrue(hasattr(engine, 'is_available'))
         self.assertTrue(hasattr(engine, 'cleanup'))
 
+    def test_transcribe_async_runs_off_loop_thread(self):
+        """Test transcribe_async returns the result from a worker thread."""
+        class TestEngine(STTEngine):
+            def load_model(self, model_path: str) -> None:
+                pass
+                
+            def transcribe(self, audio, language=None):
+                return threading.current_thread().name
+                
+            def is_ready(self) -> bool:
+                return True
+        
+        engine = TestEngine()
+        result = asyncio.run(engine.transcribe_async(np.zeros(16), 'en'))
+        
+        self.assertNotEqual(result, threading.current_thread().name)
+        self.assertTrue(result.startswith('stt-engine'))
+        engine.close()
+        self.assertIsNone(engine._executor)
+        
+        # Still usable after close(): a new worker is started
+        asyncio.run(engine.transcribe_async(np.zeros(16), 'en'))
+        engine.close()
+
 
 class TestDummyEngine(unittest.TestCase):
     """Test cases for DummyEngine class."""
@@ -178,5 +206,149 @@ class TestEngineFactory(unittest.TestCase):
                 self.assertIs(ctx_engine, engine)
 
 
+class TestEngineCache(unittest.TestCase):
+    """Test cases for the engine cache behind create_engine."""
+
+    def tearDown(self):
+        """Leave no cached engine to later tests."""
+        clear_engine_cache()
+
+    def test_same_model_is_shared(self):
+        """Test a second request for the same model reuses the engine."""
+        engine = create_engine('dummy', 'models/dummy')
+        
+        self.assertIs(create_engine('dummy', 'models/dummy'), engine)
+        self.assertIsNot(create_engine('dummy'), engine)
+
+    def test_clear_engine_cache(self):
+        """Test clearing the cache yields a freshly loaded engine."""
+        engine = create_engine('dummy', 'models/dummy')
+        
+        clear_engine_cache()
+        fresh = create_engine('dummy', 'models/dummy')
+        
+        self.assertIsNot(fresh, engine)
+        self.assertTrue(fresh.is_ready())
+
+    def test_only_latest_model_is_cached(self):
+        """Test requesting another model drops the cached one."""
+        engine = create_engine('dummy', 'models/dummy')
+        create_engine('dummy', 'models/other')
+        
+        self.assertIsNot(create_engine('dummy', 'models/dummy'), engine)
+
+    def test_warmup_runs_once_per_model(self):
+        """Test a shared engine is not warmed up again by later callers."""
+        engine = FasterWhisperEngine()
+        engine.model = Mock()
+        engine.model.transcribe.return_value = ([], None)
+        engine.ready = True
+        
+        engine.warmup()
+        engine.warmup()
+        
+        engine.model.transcribe.assert_called_once()
+
+
+class TestCoerceAudio(unittest.TestCase):
+    """Test cases for the shared audio preparation helper."""
+
+    def setUp(self):
+        """Set up a small scratch buffer."""
+        self.out = np.empty(8, dtype=np.float32)
+
+    def test_mono_column_is_flattened(self):
+        """Test (samples, 1) input becomes 1D float32."""
+        audio = np.array([[1], [2], [3]], dtype=np.float64)
+        
+        result = _coerce_audio(audio, self.out)
+        
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(np.shares_memory(result, self.out))
+        np.testing.assert_array_equal(result, [1.0, 2.0, 3.0])
+
+    def test_int16_is_scaled(self):
+        """Test int16 samples are scaled from full scale to [-1, 1)."""
+        audio = np.array([[-32768], [16384]], dtype=np.int16)
+        
+        np.testing.assert_array_equal(_coerce_audio(audio, self.out), [-1.0, 0.5])
+
+    def test_pcm_bytes(self):
+        """Test raw int16 PCM bytes are accepted."""
+        pcm = np.array([0, 16384, -16384], dtype=np.int16).tobytes()
+        
+        np.testing.assert_array_equal(_coerce_audio(pcm, self.out), [0.0, 0.5, -0.5])
+
+    def test_stereo_is_downmixed(self):
+        """Test multi-channel input is averaged to mono."""
+        audio = np.array([[0.2, 0.4], [1.0, -1.0]], dtype=np.float32)
+        
+        np.testing.assert_allclose(_coerce_audio(audio, self.out), [0.3, 0.0])
+
+    def test_long_audio_is_truncated(self):
+        """Test input longer than the buffer is clipped to its size."""
+        audio = np.arange(20, dtype=np.float32)
+        
+        result = _coerce_audio(audio, self.out)
+        
+        np.testing.assert_array_equal(result, np.arange(8))
+
+    def test_rejects_higher_dimensions(self):
+        """Test 3D input is rejected."""
+        with self.assertRaises(ValueError):
+            _coerce_audio(np.zeros((2, 2, 2), dtype=np.float32), self.out)
+
+
+class TestNormalizeInplace(unittest.TestCase):
+    """Test cases for the shared audio normalization helper."""
+
+    def test_scales_loud_audio_in_place(self):
+        """Test audio above full scale is scaled to peak 1.0 in place."""
+        audio = np.array([0.5, -4.0, 2.0], dtype=np.float32)
+        
+        peak = _normalize_inplace(audio)
+        
+        self.assertEqual(peak, 4.0)
+        np.testing.assert_allclose(audio, [0.125, -1.0, 0.5])
+
+    def test_leaves_normalized_audio_untouched(self):
+        """Test audio already within [-1, 1] is not rescaled."""
+        audio = np.array([0.25, -0.5], dtype=np.float32)
+        
+        self.assertEqual(_normalize_inplace(audio), 0.5)
+        np.testing.assert_allclose(audio, [0.25, -0.5])
+
+    def test_empty_audio(self):
+        """Test empty audio reports a zero peak."""
+        self.assertEqual(_normalize_inplace(np.array([], dtype=np.float32)), 0.0)
+
+    def test_peak_of_silence_is_below_gate(self):
+        """Test near-silent audio falls under the silence threshold."""
+        audio = np.full(16000, SILENCE_PEAK / 10, dtype=np.float32)
+        
+        self.assertLess(_peak(audio), SILENCE_PEAK)
+        self.assertEqual(_peak(np.array([], dtype=np.float32)), 0.0)
+
+
+class TestTrim(unittest.TestCase):
+    """Test cases for trimming silence before transcription."""
+
+    def test_keeps_speech_with_margin(self):
+        """Test silence is cut, keeping one frame on each side of speech."""
+        audio = np.zeros(16000, dtype=np.float32)
+        audio[8 * TRIM_HOP:10 * TRIM_HOP] = 0.5
+        
+        result = _trim(audio)
+        
+        self.assertEqual(len(result), 4 * TRIM_HOP)
+        self.assertTrue(np.shares_memory(result, audio))
+
+    def test_silence_is_empty(self):
+        """Test audio below the silence level trims to nothing."""
+        audio = np.full(16000, SILENCE_PEAK / 10, dtype=np.float32)
+        
+        self.assertEqual(len(_trim(audio)), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""Tests for log_sinks module."""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+from pathlib import Path
+
+from stt_service.core.log_sinks import QueuedSink, RotatingFileWriter
+
+
+class TestQueuedSink(unittest.TestCase):
+    """Test cases for QueuedSink."""
+
+    def test_writes_on_background_thread(self):
+        """Test messages are written in order on the writer thread."""
+        written = []
+        threads = set()
+        
+        def write(message):
+            written.append(message)
+            threads.add(threading.current_thread().name)
+        
+        sink = QueuedSink(write, name="test-writer")
+        for i in range(100):
+            sink.write(f"line {i}\n")
+        sink.stop()
+        
+        self.assertEqual(written, [f"line {i}\n" for i in range(100)])
+        self.assertEqual(threads, {"test-writer"})
+
+    def test_stop_closes_target(self):
+        """Test stop drains the queue, then calls close once."""
+        closed = []
+        sink = QueuedSink(lambda m: None, close=lambda: closed.append(True))
+        
+        sink.stop()
+        sink.stop()
+        
+        self.assertEqual(closed, [True])
+
+    def test_drops_oldest_when_full(self):
+        """Test a full queue drops the oldest messages and reports the count."""
+        started = threading.Event()
+        release = threading.Event()
+        written = []
+        
+        def write(message):
+            if not started.is_set():
+                started.set()
+                release.wait()
+            written.append(message)
+        
+        sink = QueuedSink(write, maxsize=2)
+        sink.write("first\n")
+        started.wait()
+        for i in range(10):
+            sink.write(f"line {i}\n")
+        release.set()
+        sink.stop()
+        
+        self.assertEqual(sink.dropped, 8)
+        self.assertEqual(written[0], "first\n")
+        self.assertIn("8 log messages dropped", written[1])
+        self.assertEqual(written[2:], ["line 8\n", "line 9\n"])
+
+    def test_flushes_after_idle_interval(self):
+        """Test a buffered target is flushed shortly after the last write."""
+        flushed = threading.Event()
+        sink = QueuedSink(lambda m: None, flush=flushed.set, flush_interval=0.01)
+        
+        sink.write("x\n")
+        
+        self.assertTrue(flushed.wait(timeout=2))
+        sink.stop()
+
+
+class TestRotatingFileWriter(unittest.TestCase):
+    """Test cases for RotatingFileWriter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self.temp_dir.name)
+        self.path = self.log_dir / "test.log"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_appends(self):
+        """Test messages are appended to the active file."""
+        writer = RotatingFileWriter(self.path)
+        writer.write("one\n")
+        writer.write("two\n")
+        writer.close()
+        
+        self.assertEqual(self.path.read_text(), "one\ntwo\n")
+
+    def test_buffers_until_flush(self):
+        """Test plain messages stay buffered until flush is called."""
+        writer = RotatingFileWriter(self.path)
+        writer.write("buffered\n")
+        
+        self.assertEqual(self.path.read_text(), "")
+        writer.flush()
+        self.assertEqual(self.path.read_text(), "buffered\n")
+        writer.close()
+
+    def test_rotates_by_size_and_keeps_count(self):
+        """Test size rotation compresses old files and applies retention."""
+        writer = RotatingFileWriter(self.path, max_bytes=10, keep=2, compress=True)
+        for i in range(5):
+            writer.write(f"message {i}\n")
+        writer.close()
+        
+        rotated = sorted(p for p in os.listdir(self.log_dir) if p != "test.log")
+        self.assertEqual(len(rotated), 2)
+        self.assertTrue(all(p.endswith(".log.zip") for p in rotated))
+        self.assertEqual(self.path.read_text(), "message 4\n")
+        with zipfile.ZipFile(self.log_dir / rotated[-1]) as zf:
+            self.assertEqual(zf.read(zf.namelist()[0]), b"message 3\n")
+
+    def test_rotates_by_age(self):
+        """Test time rotation once the interval has passed."""
+        writer = RotatingFileWriter(self.path, interval=3600)
+        writer.write("old\n")
+        writer._created -= 3600
+        writer.write("new\n")
+        writer.close()
+        
+        self.assertEqual(self.path.read_text(), "new\n")
+        self.assertEqual(len(list(self.log_dir.glob("test.*.log"))), 1)
+
+    def test_reopened_old_file_rotates(self):
+        """Test a file left by an earlier process keeps its age."""
+        self.path.write_text("old\n")
+        hour_ago = time.time() - 3600
+        os.utime(self.path, (hour_ago, hour_ago))
+        
+        writer = RotatingFileWriter(self.path, interval=1800)
+        writer.write("new\n")
+        writer.close()
+        
+        self.assertEqual(self.path.read_text(), "new\n")
+        self.assertEqual(len(list(self.log_dir.glob("test.*.log"))), 1)
+
+    def test_creation_time_survives_writes(self):
+        """Test the recorded creation time is not moved by later writes."""
+        writer = RotatingFileWriter(self.path)
+        writer.write("first\n")
+        writer.close()
+        if not hasattr(os, "getxattr"):
+            self.skipTest("no extended attributes on this platform")
+        try:
+            os.getxattr(self.path, "user.loguru_crtime")
+        except OSError:
+            self.skipTest("file system does not store extended attributes")
+        created = writer._created
+        
+        later = created + 3600
+        os.utime(self.path, (later, later))
+        reopened = RotatingFileWriter(self.path)
+        reopened.close()
+        
+        self.assertEqual(reopened._created, created)
+
+
+if __name__ == '__main__':
+    unittest.main()
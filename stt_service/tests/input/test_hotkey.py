@@ -1,207 +1,229 @@
 """Tests for hotkey input module."""
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import threading
-import time
+from unittest.mock import patch
 
-from stt_service.input.hotkey import HotkeyHandler, create_hotkey_handler
+from stt_service.input.hotkey import HotkeyHandler, PynputHotkeyHandler, create_hotkey_handler
+
+
+class Spy:
+    """Callback that records its calls; lighter than a Mock."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
 
 
 class TestHotkeyHandler(unittest.TestCase):
     """Test cases for HotkeyHandler class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Patch the backend import once for the whole class."""
+        cls._import_patcher = patch('stt_service.input.hotkey.optional_import')
+        cls.mock_import = cls._import_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Undo the class-wide import patch."""
+        cls._import_patcher.stop()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.config = {
-            'keys': ['ctrl', 'space'],
-            'hold_duration': 0.1,
-            'trigger_on_release': True
-        }
-        self.callback = Mock()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_hotkey_handler_initialization(self, mock_keyboard):
+        # The mock is shared: clear calls and side effects of earlier tests
+        self.mock_import.reset_mock(return_value=True, side_effect=True)
+        # The stand-in for the keyboard library
+        self.mock_keyboard = self.mock_import.return_value
+        self.callback = Spy()
+
+    def test_hotkey_handler_initialization(self):
         """Test HotkeyHandler initialization."""
-        handler = HotkeyHandler(self.config, self.callback)
-        
-        self.assertEqual(handler.keys, ['ctrl', 'space'])
-        self.assertEqual(handler.hold_duration, 0.1)
-        self.assertEqual(handler.trigger_on_release, True)
-        self.assertEqual(handler.callback, self.callback)
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_hotkey_registration(self, mock_keyboard):
+        handler = HotkeyHandler('ctrl+space')
+
+        self.assertEqual(handler.hotkey, 'ctrl+space')
+        self.assertTrue(handler.available)
+        self.assertFalse(handler.is_active())
+        self.mock_import.assert_called_once_with('keyboard')
+
+    def test_default_hotkey(self):
+        """Test the default hotkey combination."""
+        self.assertEqual(HotkeyHandler().hotkey, 'ctrl+shift+space')
+
+    def test_keyboard_library_missing(self):
+        """Test starting without the keyboard library raises."""
+        self.mock_import.return_value = None
+
+        handler = HotkeyHandler('ctrl+space')
+
+        self.assertFalse(handler.available)
+        with self.assertRaises(RuntimeError):
+            handler.start(self.callback)
+        self.assertFalse(handler.is_active())
+
+    def test_hotkey_registration(self):
         """Test hotkey registration with keyboard library."""
-        handler = HotkeyHandler(self.config, self.callback)
-        handler.start()
-        
-        mock_keyboard.add_hotkey.assert_called()
-        call_args = mock_keyboard.add_hotkey.call_args
-        self.assertIn('ctrl+space', str(call_args))
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_hotkey_callback_execution(self, mock_keyboard):
+        handler = HotkeyHandler('ctrl+space')
+        handler.start(self.callback)
+
+        self.mock_keyboard.add_hotkey.assert_called_once_with('ctrl+space', handler._on_hotkey_pressed)
+        self.assertTrue(handler.is_active())
+
+    def test_start_twice_registers_once(self):
+        """Test a second start() on an active handler is ignored."""
+        handler = HotkeyHandler('ctrl+space')
+        handler.start(self.callback)
+        handler.start(self.callback)
+
+        self.assertEqual(self.mock_keyboard.add_hotkey.call_count, 1)
+
+    def test_hotkey_callback_execution(self):
         """Test hotkey callback execution."""
-        handler = HotkeyHandler(self.config, self.callback)
-        
+        handler = HotkeyHandler('ctrl+space')
+        handler.start(self.callback)
+
         # Simulate hotkey press
-        handler._on_hotkey_press()
-        
-        # Should not call callback immediately for hold-type hotkeys
-        self.callback.assert_not_called()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_hotkey_hold_duration(self, mock_keyboard):
-        """Test hotkey hold duration functionality."""
-        handler = HotkeyHandler(self.config, self.callback)
-        
-        # Start press
-        handler._on_hotkey_press()
-        
-        # Wait less than hold duration
-        time.sleep(0.05)
-        
-        # Release
-        handler._on_hotkey_release()
-        
-        # Should not trigger callback (held for less than required duration)
-        self.callback.assert_not_called()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_hotkey_successful_hold(self, mock_keyboard):
-        """Test successful hotkey hold and release."""
-        config = self.config.copy()
-        config['hold_duration'] = 0.05  # Very short for testing
-        
-        handler = HotkeyHandler(config, self.callback)
-        
-        # Start press
-        handler._on_hotkey_press()
-        
-        # Wait longer than hold duration
-        time.sleep(0.1)
-        
-        # Release
-        handler._on_hotkey_release()
-        
-        # Should trigger callback
-        self.callback.assert_called_once()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_hotkey_stop(self, mock_keyboard):
+        handler._on_hotkey_pressed()
+
+        self.assertEqual(self.callback.calls, [((), {})])
+
+    def test_callback_error_is_contained(self):
+        """Test an exception in the callback does not reach the listener."""
+        def failing_callback():
+            raise ValueError("callback failed")
+
+        handler = HotkeyHandler('ctrl+space')
+        handler.start(failing_callback)
+
+        # Should handle the exception gracefully
+        handler._on_hotkey_pressed()
+
+    def test_hotkey_stop(self):
         """Test stopping hotkey handler."""
-        handler = HotkeyHandler(self.config, self.callback)
-        handler.start()
+        handler = HotkeyHandler('ctrl+space')
+        handler.start(self.callback)
         handler.stop()
-        
-        mock_keyboard.remove_hotkey.assert_called()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_hotkey_context_manager(self, mock_keyboard):
-        """Test HotkeyHandler as context manager."""
-        with HotkeyHandler(self.config, self.callback) as handler:
-            self.assertIsNotNone(handler)
-            mock_keyboard.add_hotkey.assert_called()
-        
-        mock_keyboard.remove_hotkey.assert_called()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_different_key_combinations(self, mock_keyboard):
+
+        self.mock_keyboard.remove_hotkey.assert_called_once_with('ctrl+space')
+        self.assertFalse(handler.is_active())
+
+        # A press after stop() no longer reaches the callback
+        handler._on_hotkey_pressed()
+        self.assertEqual(self.callback.calls, [])
+
+    def test_stop_when_not_started(self):
+        """Test stop() before start() does not touch the keyboard library."""
+        HotkeyHandler('ctrl+space').stop()
+
+        self.mock_keyboard.remove_hotkey.assert_not_called()
+
+    def test_different_key_combinations(self):
         """Test different hotkey combinations."""
         test_cases = [
-            ['ctrl', 'alt', 'space'],
-            ['shift', 'f1'],
-            ['ctrl', 'shift', 'r'],
-            ['alt', 'tab']
+            'ctrl+alt+space',
+            'shift+f1',
+            'ctrl+shift+r',
+            'alt+tab',
         ]
-        
-        for keys in test_cases:
-            config = self.config.copy()
-            config['keys'] = keys
-            
-            handler = HotkeyHandler(config, self.callback)
-            handler.start()
-            
-            mock_keyboard.add_hotkey.assert_called()
-            handler.stop()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_immediate_trigger_mode(self, mock_keyboard):
-        """Test immediate trigger mode (no hold required)."""
-        config = {
-            'keys': ['f1'],
-            'trigger_on_release': False,
-            'hold_duration': 0
-        }
-        
-        handler = HotkeyHandler(config, self.callback)
-        
-        # Simulate press
-        handler._on_hotkey_press()
-        
-        # Should trigger callback immediately
-        self.callback.assert_called_once()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_error_handling(self, mock_keyboard):
+
+        for hotkey in test_cases:
+            with self.subTest(hotkey=hotkey):
+                # Otherwise the first iteration's call satisfies every check
+                self.mock_keyboard.reset_mock()
+                handler = HotkeyHandler(hotkey)
+                handler.start(self.callback)
+
+                self.mock_keyboard.add_hotkey.assert_called_once_with(hotkey, handler._on_hotkey_pressed)
+                handler.stop()
+
+    def test_error_handling(self):
         """Test error handling in hotkey registration."""
-        mock_keyboard.add_hotkey.side_effect = Exception("Hotkey registration failed")
-        
-        handler = HotkeyHandler(self.config, self.callback)
-        
-        # Should handle the exception gracefully
+        self.mock_keyboard.add_hotkey.side_effect = Exception("Hotkey registration failed")
+
+        handler = HotkeyHandler('ctrl+space')
+
         with self.assertRaises(Exception):
-            handler.start()
+            handler.start(self.callback)
+        self.assertFalse(handler.is_active())
 
 
-class TestHotkeyFactory(unittest.TestCase):
-    """Test cases for hotkey handler factory function."""
+@patch('stt_service.input.hotkey.optional_import')
+class TestPynputHotkeyHandler(unittest.TestCase):
+    """Test cases for PynputHotkeyHandler class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.config = {
-            'hotkey': {
-                'keys': ['ctrl', 'space'],
-                'hold_duration': 0.1,
-                'trigger_on_release': True
-            }
-        }
-        self.callback = Mock()
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_create_hotkey_handler(self, mock_keyboard):
+        self.callback = Spy()
+
+    def test_initialization(self, mock_import):
+        """Test PynputHotkeyHandler initialization."""
+        handler = PynputHotkeyHandler('ctrl+shift+space')
+
+        self.assertTrue(handler.available)
+        self.assertFalse(handler.is_active())
+        mock_import.assert_called_once_with('pynput.keyboard')
+
+    def test_start_registers_global_hotkey(self, mock_import):
+        """Test start() builds and starts a GlobalHotKeys listener."""
+        pynput_keyboard = mock_import.return_value
+        handler = PynputHotkeyHandler('ctrl+shift+space')
+        handler.start(self.callback)
+
+        pynput_keyboard.GlobalHotKeys.assert_called_once_with(
+            {'<ctrl>+<shift>+<space>': handler._on_hotkey_pressed})
+        pynput_keyboard.GlobalHotKeys.return_value.start.assert_called_once()
+        self.assertTrue(handler.is_active())
+
+        handler._on_hotkey_pressed()
+        self.assertEqual(len(self.callback.calls), 1)
+
+    def test_stop(self, mock_import):
+        """Test stop() stops the listener."""
+        listener = mock_import.return_value.GlobalHotKeys.return_value
+        handler = PynputHotkeyHandler('ctrl+shift+space')
+        handler.start(self.callback)
+        handler.stop()
+
+        listener.stop.assert_called_once()
+        self.assertFalse(handler.is_active())
+
+    def test_pynput_missing(self, mock_import):
+        """Test starting without pynput raises."""
+        mock_import.return_value = None
+
+        handler = PynputHotkeyHandler('ctrl+shift+space')
+
+        with self.assertRaises(RuntimeError):
+            handler.start(self.callback)
+
+
+@patch('stt_service.input.hotkey.optional_import')
+class TestHotkeyFactory(unittest.TestCase):
+    """Test cases for hotkey handler factory function."""
+
+    def test_create_hotkey_handler(self, mock_import):
         """Test creating hotkey handler with factory function."""
-        handler = create_hotkey_handler(self.config, self.callback)
-        
+        handler = create_hotkey_handler('ctrl+space')
+
         self.assertIsInstance(handler, HotkeyHandler)
-        self.assertEqual(handler.keys, ['ctrl', 'space'])
+        self.assertEqual(handler.hotkey, 'ctrl+space')
 
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_create_hotkey_handler_with_defaults(self, mock_keyboard):
+    def test_create_hotkey_handler_with_defaults(self, mock_import):
         """Test creating hotkey handler with default configuration."""
-        minimal_config = {}
-        
-        handler = create_hotkey_handler(minimal_config, self.callback)
-        
+        handler = create_hotkey_handler()
+
         self.assertIsInstance(handler, HotkeyHandler)
         # Should use default keys
-        self.assertIsNotNone(handler.keys)
-
-    @patch('stt_service.input.hotkey.keyboard')
-    def test_create_hotkey_handler_invalid_config(self, mock_keyboard):
-        """Test creating hotkey handler with invalid configuration."""
-        invalid_config = {
-            'hotkey': {
-                'keys': [],  # Empty keys list
-                'hold_duration': -1  # Invalid duration
-            }
-        }
-        
-        # Should handle invalid config gracefully
-        handler = create_hotkey_handler(invalid_config, self.callback)
-        self.assertIsInstance(handler, HotkeyHandler)
+        self.assertEqual(handler.hotkey, 'ctrl+shift+space')
+
+    def test_create_pynput_handler(self, mock_import):
+        """Test selecting the pynput backend."""
+        handler = create_hotkey_handler('ctrl+space', backend='pynput')
+
+        self.assertIsInstance(handler, PynputHotkeyHandler)
+        self.assertEqual(handler.hotkey, 'ctrl+space')
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,116 +1,91 @@
 """Tests for keyboard output module."""
 
+import threading
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import patch, call
 
-from stt_service.output.keyboard import KeyboardHandler, create_output_handler
+from stt_service.output.base import OutputHandler
+from stt_service.output.keyboard import ClipboardHandler, CompositeHandler, KeyboardHandler, create_output_handler
 
 
+@patch('stt_service.output.keyboard.optional_import')
 class TestKeyboardHandler(unittest.TestCase):
     """Test cases for KeyboardHandler class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = {
-            'output_target': 'active_window',
-            'typing_delay': 0.01,
-            'clear_clipboard': True
-        }
+    # Keyword arguments shared by the handlers under test
+    config = MappingProxyType({
+        'delay': 0.01,
+        'paste_threshold': 20,
+    })
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_keyboard_output_initialization(self, mock_pyautogui):
+    def test_keyboard_output_initialization(self, mock_import):
         """Test KeyboardHandler initialization."""
-        output = KeyboardHandler(self.config)
+        output = KeyboardHandler(**self.config)
         
-        self.assertEqual(output.output_target, 'active_window')
-        self.assertEqual(output.typing_delay, 0.01)
-        self.assertTrue(output.clear_clipboard)
+        self.assertEqual(output.delay, 0.01)
+        self.assertEqual(output.paste_threshold, 20)
+        self.assertTrue(output.is_available())
+        mock_import.assert_any_call('pynput.keyboard')
+        mock_import.assert_any_call('pyperclip')
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_output_to_active_window(self, mock_pyautogui):
-        """Test outputting text to active window."""
-        output = KeyboardHandler(self.config)
+    def test_output_to_active_window(self, mock_import):
+        """Test short text is typed through the pynput controller."""
+        output = KeyboardHandler(**self.config)
         test_text = "Hello, world!"
         
-        output.output(test_text)
+        self.assertTrue(output.send_text(test_text))
         
-        mock_pyautogui.typewrite.assert_called_once_with(test_text, interval=0.01)
+        output.controller.type.assert_called_once_with(test_text)
+        output.pyperclip.copy.assert_not_called()
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    @patch('stt_service.output.keyboard.pyperclip')
-    def test_output_to_clipboard(self, mock_pyperclip, mock_pyautogui):
-        """Test outputting text to clipboard."""
-        config = self.config.copy()
-        config['output_target'] = 'clipboard'
-        
-        output = KeyboardHandler(config)
-        test_text = "Clipboard text"
+    def test_output_to_clipboard_and_paste(self, mock_import):
+        """Test text over the paste threshold is pasted with Ctrl+V."""
+        output = KeyboardHandler(**self.config)
+        test_text = "Paste this text, it is long"
         
-        output.output(test_text)
+        self.assertTrue(output.send_text(test_text))
         
-        mock_pyperclip.copy.assert_called_once_with(test_text)
-        mock_pyautogui.typewrite.assert_not_called()
+        output.pyperclip.copy.assert_called_once_with(test_text)
+        output.controller.pressed.assert_called_once_with(output.keyboard.Key.ctrl)
+        output.controller.press.assert_called_once_with('v')
+        output.controller.type.assert_not_called()
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    @patch('stt_service.output.keyboard.pyperclip')
-    def test_output_to_clipboard_and_paste(self, mock_pyperclip, mock_pyautogui):
-        """Test outputting text to clipboard and pasting."""
-        config = self.config.copy()
-        config['output_target'] = 'clipboard_paste'
+    def test_clipboard_failure_falls_back_to_typing(self, mock_import):
+        """Test long text is typed when the clipboard cannot be set."""
+        output = KeyboardHandler(**self.config)
+        output.pyperclip.copy.side_effect = Exception("No clipboard")
+        test_text = "Paste this text, it is long"
         
-        output = KeyboardHandler(config)
-        test_text = "Paste this text"
+        self.assertTrue(output.send_text(test_text))
         
-        output.output(test_text)
-        
-        mock_pyperclip.copy.assert_called_once_with(test_text)
-        mock_pyautogui.hotkey.assert_called_with('ctrl', 'v')
+        output.controller.type.assert_called_once_with(test_text)
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_typing_delay_configuration(self, mock_pyautogui):
-        """Test typing delay configuration."""
-        config = self.config.copy()
-        config['typing_delay'] = 0.05
-        
-        output = KeyboardHandler(config)
-        test_text = "Slow typing"
+    def test_paste_disabled_by_default(self, mock_import):
+        """Test without a paste threshold long text is always typed."""
+        output = KeyboardHandler()
+        test_text = "x" * 100
         
-        output.output(test_text)
+        output.send_text(test_text)
         
-        mock_pyautogui.typewrite.assert_called_once_with(test_text, interval=0.05)
+        self.assertIsNone(output.pyperclip)
+        output.controller.type.assert_called_once_with(test_text)
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_empty_text_handling(self, mock_pyautogui):
+    def test_empty_text_handling(self, mock_import):
         """Test handling of empty text."""
-        output = KeyboardHandler(self.config)
+        output = KeyboardHandler(**self.config)
         
         # Empty string
-        output.output("")
-        mock_pyautogui.typewrite.assert_not_called()
-        
+        self.assertTrue(output.send_text(""))
         # None
-        output.output(None)
-        self.assertEqual(mock_pyautogui.typewrite.call_count, 0)
+        self.assertTrue(output.send_text(None))
         
-        # Whitespace only
-        output.output("   ")
-        mock_pyautogui.typewrite.assert_not_called()
+        output.controller.type.assert_not_called()
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_text_preprocessing(self, mock_pyautogui):
-        """Test text preprocessing before output."""
-        output = KeyboardHandler(self.config)
-        
-        # Test trimming whitespace
-        test_text = "  Hello, world!  "
-        output.output(test_text)
-        
-        mock_pyautogui.typewrite.assert_called_once_with("Hello, world!", interval=0.01)
-
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_special_characters_handling(self, mock_pyautogui):
+    def test_special_characters_handling(self, mock_import):
         """Test handling of special characters."""
-        output = KeyboardHandler(self.config)
+        # No paste threshold: every text goes through Controller.type
+        output = KeyboardHandler()
         
         test_cases = [
             "Hello\nworld",  # Newline
@@ -120,92 +95,126 @@ class TestKeyboardHandler(unittest.TestCase):
         ]
         
         for text in test_cases:
-            mock_pyautogui.reset_mock()
-            output.output(text)
-            mock_pyautogui.typewrite.assert_called_once_with(text, interval=0.01)
+            output.send_text(text)
+        
+        # One type() per text, in order, each with the text unchanged
+        expected = [call(text) for text in test_cases]
+        self.assertEqual(output.controller.type.call_args_list, expected)
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_error_handling(self, mock_pyautogui):
+    def test_error_handling(self, mock_import):
         """Test error handling in keyboard output."""
-        mock_pyautogui.typewrite.side_effect = Exception("Keyboard error")
-        
-        output = KeyboardHandler(self.config)
+        output = KeyboardHandler(**self.config)
+        output.controller.type.side_effect = Exception("Keyboard error")
         
         # Should handle the exception gracefully
-        try:
-            output.output("Test text")
-        except Exception:
-            self.fail("KeyboardHandler should handle exceptions gracefully")
+        self.assertFalse(output.send_text("Test text"))
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_is_available(self, mock_pyautogui):
-        """Test availability checking."""
-        output = KeyboardHandler(self.config)
+    def test_pynput_missing(self, mock_import):
+        """Test the handler reports unavailable without pynput."""
+        mock_import.return_value = None
         
-        # Should be available if pyautogui is working
-        self.assertTrue(output.is_available())
+        output = KeyboardHandler()
         
-        # Test when pyautogui fails
-        mock_pyautogui.typewrite.side_effect = Exception("Not available")
-        # Even with errors, should still report as available (error handling is internal)
-        self.assertTrue(output.is_available())
-
-    @patch('stt_service.output.keyboard.pyautogui')
-    @patch('stt_service.output.keyboard.pyperclip')
-    def test_clipboard_clearing(self, mock_pyperclip, mock_pyautogui):
-        """Test clipboard clearing functionality."""
-        config = self.config.copy()
-        config['clear_clipboard'] = True
-        
-        output = KeyboardHandler(config)
-        test_text = "Text to clear"
-        
-        output.output(test_text)
-        
-        # Should type the text
-        mock_pyautogui.typewrite.assert_called_once_with(test_text, interval=0.01)
+        self.assertFalse(output.is_available())
+        self.assertFalse(output.send_text("Test text"))
 
 
+@patch('stt_service.output.keyboard.optional_import')
 class TestKeyboardHandlerFactory(unittest.TestCase):
     """Test cases for keyboard output factory function."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = {
-            'output_target': 'active_window',
-            'typing_delay': 0.01
-        }
-
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_create_output_handler(self, mock_pyautogui):
+    def test_create_output_handler(self, mock_import):
         """Test creating keyboard output handler with factory function."""
-        handler = create_output_handler(self.config)
+        handler = create_output_handler('keyboard', pre_type_delay=0.2, paste_threshold=50)
         
         self.assertIsInstance(handler, KeyboardHandler)
-        self.assertEqual(handler.output_target, 'active_window')
+        self.assertEqual(handler.pre_type_delay, 0.2)
+        self.assertEqual(handler.paste_threshold, 50)
 
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_create_output_handler_with_defaults(self, mock_pyautogui):
+    def test_create_output_handler_with_defaults(self, mock_import):
         """Test creating keyboard output handler with default configuration."""
-        minimal_config = {}
-        
-        handler = create_output_handler(minimal_config)
+        handler = create_output_handler()
         
         self.assertIsInstance(handler, KeyboardHandler)
         # Should use default values
-        self.assertIsNotNone(handler.output_target)
-
-    @patch('stt_service.output.keyboard.pyautogui')
-    def test_create_output_handler_different_targets(self, mock_pyautogui):
-        """Test creating handlers for different output targets."""
-        targets = ['active_window', 'clipboard', 'clipboard_paste']
-        
-        for target in targets:
-            config = {'output_target': target}
-            handler = create_output_handler(config)
-            
-            self.assertIsInstance(handler, KeyboardHandler)
-            self.assertEqual(handler.output_target, target)
+        self.assertEqual(handler.pre_type_delay, 0.0)
+        self.assertIsNone(handler.paste_threshold)
+
+    def test_create_output_handler_different_targets(self, mock_import):
+        """Test creating handlers for different output methods."""
+        methods = {
+            'keyboard': KeyboardHandler,
+            'clipboard': ClipboardHandler,
+            'both': CompositeHandler,
+            # Unknown methods fall back to typing
+            'unknown': KeyboardHandler,
+        }
+        
+        for method, handler_class in methods.items():
+            with self.subTest(method=method):
+                handler = create_output_handler(method)
+                
+                self.assertIsInstance(handler, handler_class)
+                handler.close()
+
+
+class _FakeHandler(OutputHandler):
+    """Output handler that returns a fixed result, optionally after a gate."""
+
+    def __init__(self, result=True, gate=None):
+        self.result = result
+        self.gate = gate
+        self.sent = []
+        self.closed = False
+
+    def send_text(self, text):
+        if self.gate is not None:
+            self.gate.wait()
+        self.sent.append(text)
+        return self.result
+
+    def is_available(self):
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+class TestCompositeHandler(unittest.TestCase):
+    """Test cases for CompositeHandler class."""
+
+    def test_sends_to_all_handlers(self):
+        """Test every handler receives the text."""
+        first, second = _FakeHandler(), _FakeHandler(result=False)
+        composite = CompositeHandler(first, second)
+        self.addCleanup(composite.close)
+
+        self.assertTrue(composite.send_text("hello"))
+        self.assertEqual((first.sent, second.sent), (["hello"], ["hello"]))
+
+    def test_hung_handler_times_out(self):
+        """Test a handler still running after the timeout counts as failed."""
+        gate = threading.Event()
+        # Release the stuck handler so its thread ends with the test
+        self.addCleanup(gate.set)
+        composite = CompositeHandler(_FakeHandler(gate=gate), _FakeHandler(result=False),
+                                     timeout=0.05)
+        self.addCleanup(composite.close)
+
+        self.assertFalse(composite.send_text("hello"))
+
+    def test_close_releases_pool_and_handlers(self):
+        """Test close() shuts the pool down and the handler stays usable."""
+        first, second = _FakeHandler(), _FakeHandler()
+        composite = CompositeHandler(first, second)
+        composite.send_text("one")
+
+        composite.close()
+
+        self.assertIsNone(composite._pool)
+        self.assertTrue(first.closed and second.closed)
+        self.assertTrue(composite.send_text("two"))
+        composite.close()
 
 
 if __name__ == '__main__':
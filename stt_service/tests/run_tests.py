@@ -1,50 +1,212 @@
 """Test runner for STT Service tests."""
 
+import functools
+import importlib
+import importlib.util
+import io
 import unittest
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Add the parent directory to the path so we can import stt_service
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-def run_all_tests():
-    """Run all tests in the tests directory."""
-    # Discover and run all tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.dirname(os.path.abspath(__file__))
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result.wasSuccessful()
+# Test modules run by run_all_tests(); add new test files here (or run
+# with --discover, which finds every test_*.py)
+_TEST_MODULES = (
+    'stt_service.tests.core.test_audio_capture',
+    'stt_service.tests.core.test_config',
+    'stt_service.tests.core.test_dsp',
+    'stt_service.tests.core.test_engine',
+    'stt_service.tests.core.test_log_sinks',
+    'stt_service.tests.input.test_base',
+    'stt_service.tests.input.test_hotkey',
+    'stt_service.tests.output.test_base',
+    'stt_service.tests.output.test_keyboard',
+    'stt_service.tests.test_cli',
+    'stt_service.tests.test_integration',
+    'stt_service.tests.test_service',
+)
+
+
+def _make_runner(stream=None):
+    """Build the test runner shared by all entry points.
+
+    Per-test lines are printed only on a terminal, and output of passing
+    tests is discarded (``buffer``); ``FAILFAST=1`` stops at the first
+    failure.
+    """
+    return unittest.TextTestRunner(
+        stream=stream or sys.stdout,
+        verbosity=2 if sys.stdout.isatty() else 1,
+        buffer=True,
+        failfast=os.environ.get('FAILFAST') == '1',
+    )
+
+
+class _DefinitionOrderLoader(unittest.TestLoader):
+    """Loader that keeps test methods in definition order.
+
+    Tests sharing fixtures are written next to each other; alphabetical
+    sorting would interleave them.
+    """
+
+    def getTestCaseNames(self, testCaseClass):
+        names = super().getTestCaseNames(testCaseClass)
+        # Class bodies keep definition order; base class tests come first
+        order = {}
+        for cls in reversed(testCaseClass.__mro__):
+            for name in vars(cls):
+                order.setdefault(name, len(order))
+        return sorted(names, key=order.__getitem__)
+
+
+def _make_loader():
+    """Build the loader used for every test run."""
+    return _DefinitionOrderLoader()
+
+
+def _iter_tests(suite):
+    """Yield the individual test cases of a (nested) test suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _run_shard(test_ids):
+    """Run a list of test ids in a worker process.
+
+    TestResult objects hold test cases and tracebacks, which do not pickle,
+    so only the counts, failure reports and runner output are returned.
+    """
+    stream = io.StringIO()
+    suite = _make_loader().loadTestsFromNames(test_ids)
+    result = _make_runner(stream).run(suite)
+    return {
+        'run': result.testsRun,
+        'failures': [(test.id(), tb) for test, tb in result.failures],
+        'errors': [(test.id(), tb) for test, tb in result.errors],
+        'skipped': len(result.skipped),
+        'ok': result.wasSuccessful(),
+        'output': stream.getvalue(),
+    }
+
+
+def _run_with_xdist():
+    """Run the suite with pytest-xdist, one test file per worker at a time.
+
+    Returns:
+        True if all tests passed, or None if pytest-xdist is not installed
+    """
+    if importlib.util.find_spec('xdist') is None:
+        return None
+    import pytest
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    # loadfile keeps a file's tests (and their module fixtures) together
+    return pytest.main(['-n', 'auto', '--dist=loadfile', '-q', tests_dir]) == 0
 
 
-def run_specific_module_tests(module_name):
-    """Run tests for a specific module."""
-    loader = unittest.TestLoader()
+def run_all_tests(serial=False, discover=False):
+    """Run all tests in the tests directory.
+
+    With pytest-xdist installed the suite is handed to pytest. Otherwise
+    tests are split round-robin into one shard per CPU and run in worker
+    processes; ``serial=True`` runs them in this process instead, which is
+    easier to debug. The modules in ``_TEST_MODULES`` are loaded directly;
+    ``discover=True`` walks the directory for test files instead.
+    """
+    if not (serial or discover):
+        success = _run_with_xdist()
+        if success is not None:
+            return success
+
+    loader = _make_loader()
+    if discover:
+        start_dir = os.path.dirname(os.path.abspath(__file__))
+        suite = loader.discover(start_dir, pattern='test_*.py')
+    else:
+        suite = unittest.TestSuite(loader.loadTestsFromName(name) for name in _TEST_MODULES)
+
+    workers = os.cpu_count() or 1
+    if serial or workers == 1:
+        runner = _make_runner()
+        result = runner.run(suite)
+        return result.wasSuccessful()
+
+    # Modules that failed to import show up as placeholder tests that
+    # cannot be loaded again by id; those run here to report the error
+    test_ids, local = [], unittest.TestSuite()
+    for test in _iter_tests(suite):
+        if test.id().startswith('unittest.'):
+            local.addTest(test)
+        else:
+            test_ids.append(test.id())
+
+    shards = [test_ids[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_run_shard, [shard for shard in shards if shard]))
+
+    for shard in results:
+        sys.stderr.write(shard['output'])
+    success = all(shard['ok'] for shard in results)
+    if local.countTestCases():
+        success = _make_runner().run(local).wasSuccessful() and success
+
+    tests_run = sum(shard['run'] for shard in results)
+    failures = sum(len(shard['failures']) for shard in results)
+    errors = sum(len(shard['errors']) for shard in results)
+    skipped = sum(shard['skipped'] for shard in results)
+    print(f"\nRan {tests_run} tests in {len(results)} processes: "
+          f"{failures} failures, {errors} errors, {skipped} skipped")
+
+    return success
+
+
+@functools.lru_cache(maxsize=None)
+def _load_test_module(module_name):
+    """Import a test module once.
+
+    Only the module is cached: a TestSuite drops its tests as it runs them,
+    so suites are loaded afresh for every run.
+    """
+    return importlib.import_module(f'stt_service.tests.{module_name}')
+
+
+def run_specific_module_tests(*module_names):
+    """Run tests for one or more modules in a single process.
+
+    Batching modules shares one import of ``stt_service`` between them.
+    """
+    loader = _make_loader()
     suite = unittest.TestSuite()
-    
-    # Import and add specific test module
-    test_module = __import__(f'stt_service.tests.{module_name}', fromlist=[''])
-    suite.addTests(loader.loadTestsFromModule(test_module))
-    
-    runner = unittest.TextTestRunner(verbosity=2)
+
+    # Import and add specific test modules
+    for module_name in module_names:
+        suite.addTests(loader.loadTestsFromModule(_load_test_module(module_name)))
+
+    runner = _make_runner()
     result = runner.run(suite)
-    
+
     return result.wasSuccessful()
 
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
+    # First Ctrl-C ends the run after the current test, with a report
+    unittest.installHandler()
+    args = sys.argv[1:]
+    flags = {arg for arg in args if arg.startswith('--')}
+    args = [arg for arg in args if not arg.startswith('--')]
+    if args:
         # Run specific module tests
-        module = sys.argv[1]
-        print(f"Running tests for {module}...")
-        success = run_specific_module_tests(module)
+        print(f"Running tests for {', '.join(args)}...")
+        success = run_specific_module_tests(*args)
     else:
         # Run all tests
         print("Running all STT Service tests...")
-        success = run_all_tests()
-    
-    sys.exit(0 if success else 1)
\ No newline at end of file
+        success = run_all_tests(serial='--serial' in flags, discover='--discover' in flags)
+
+    sys.exit(0 if success else 1)
@@ -0,0 +1,37 @@
+"""Tests for the command-line interface."""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import cli
+
+
+class TestStaticHelp(unittest.TestCase):
+    """Test cases for the argparse-free top-level help."""
+
+    @unittest.skipIf(sys.version_info < (3, 10),
+                     "argparse titles the options section differently before 3.10")
+    def test_static_help_matches_parser(self):
+        """Test STATIC_HELP is what the full parser would print."""
+        # argparse wraps to the terminal width; STATIC_HELP is 80 columns
+        with patch.dict(os.environ, {'COLUMNS': '80'}):
+            parser = cli.build_parser()
+            expected = parser.format_help()
+
+        self.assertEqual(cli.STATIC_HELP % {'prog': parser.prog}, expected)
+
+    def test_fast_path_prints_static_help(self):
+        """Test --help is answered without building the parser."""
+        with patch('cli.build_parser') as build_parser, patch('sys.stdout') as stdout:
+            with self.assertRaises(SystemExit) as cm:
+                cli._fast_path(['--help'])
+
+        self.assertEqual(cm.exception.code, 0)
+        build_parser.assert_not_called()
+        stdout.write.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
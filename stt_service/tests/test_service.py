@@ -1,256 +1,209 @@
 """Tests for the main STT service."""
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import tempfile
-import os
-import threading
-import time
+from unittest.mock import DEFAULT, patch, create_autospec
 
+from stt_service.core.audio_capture import AudioCapture
+from stt_service.core.config import Config
+from stt_service.core.engine import STTEngine
+from stt_service.input.base import InputHandler
+from stt_service.output.base import OutputHandler
 from stt_service.service import STTService
 
 
+# Payloads shared by the tests; bytes and str are immutable, so one each
+_FAKE_AUDIO = b'fake_audio_data'
+_FAKE_TRANSCRIPT = "Hello world"
+# Message of the engine error in error tests. Build a fresh exception per
+# test: a shared instance keeps accumulating traceback frames
+_TRANSCRIBE_ERROR = "Transcription failed"
+
+
+def _make_audio_mock():
+    """Build an AudioCapture mock whose recordings return _FAKE_AUDIO."""
+    audio = create_autospec(AudioCapture, instance=True)
+    audio.start_recording.return_value = None
+    audio.stop_recording.return_value = _FAKE_AUDIO
+    return audio
+
+
+class _StubService(STTService):
+    """STTService wired to the given collaborators, bypassing the factories.
+    
+    start()/stop() are the real ones; for tests that only check lifecycle
+    state and do not need the patched construction path.
+    """
+
+    def __init__(self, engine, audio_capture, input_handler, output_handler):
+        self._components = (engine, audio_capture, input_handler, output_handler)
+        # from_dict: no config files are searched
+        super().__init__(Config.from_dict({}))
+
+    def _initialize_components(self) -> None:
+        self.engine, self.audio_capture, self.input_handler, self.output_handler = self._components
+
+
 class TestSTTService(unittest.TestCase):
     """Test cases for STTService class."""
 
+    # Names in stt_service.service replaced for the whole class
+    _PATCHED = {
+        'mock_config': 'Config',
+        'mock_engine': 'create_engine',
+        'mock_audio': 'AudioCapture',
+        'mock_hotkey': 'create_hotkey_handler',
+        'mock_output': 'create_output_handler',
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch the service's collaborators once for the whole class."""
+        # One patcher: the target module is resolved once for all names
+        cls._patcher = patch.multiple('stt_service.service',
+                                      **{name: DEFAULT for name in cls._PATCHED.values()})
+        mocks = cls._patcher.start()
+        for attr, name in cls._PATCHED.items():
+            setattr(cls, attr, mocks[name])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Undo the class-wide patches."""
+        cls._patcher.stop()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.config_dict = {
-            'language': 'en',
-            'engine': 'dummy',
-            'input_device': 'default',
-            'output_target': 'active_window',
-            'hotkey': {
-                'keys': ['ctrl', 'space'],
-                'hold_duration': 0.1,
-                'trigger_on_release': True
-            }
-        }
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_initialization(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
+        """Set up test fixtures.
+        
+        Every collaborator gets a fresh autospec instance; tests only
+        configure the ones whose behaviour they check.
+        """
+        # The mocks are shared: clear calls and return values of earlier tests
+        for attr in self._PATCHED:
+            getattr(self, attr).reset_mock(return_value=True, side_effect=True)
+        # A real Config: the service reads settings through Config.get()
+        self.config = self.mock_config.return_value = Config.from_dict({
+            'service': {'language': 'en', 'audio_device': 'default'},
+            'input': {'hotkey': 'ctrl+space'},
+            'model': {'type': 'dummy', 'path': ''},
+        })
+        self.engine = self.mock_engine.return_value = create_autospec(STTEngine, instance=True)
+        self.audio = self.mock_audio.return_value = _make_audio_mock()
+        self.hotkey = self.mock_hotkey.return_value = create_autospec(InputHandler, instance=True)
+        self.output = self.mock_output.return_value = create_autospec(OutputHandler, instance=True)
+
+    def _stub_service(self):
+        """Build a service directly on the setUp collaborators."""
+        return _StubService(self.engine, self.audio, self.hotkey, self.output)
+
+    def test_stt_service_initialization(self):
         """Test STTService initialization."""
-        # Setup mocks
-        mock_config.return_value = self.config_dict
-        mock_engine.return_value = Mock()
-        mock_audio.return_value = Mock()
-        mock_hotkey.return_value = Mock()
-        mock_output.return_value = Mock()
-        
         service = STTService()
         
-        self.assertIsNotNone(service.config)
+        self.assertIs(service.config, self.config)
+        self.mock_engine.assert_called_once_with('dummy', '')
         self.assertIsNotNone(service.engine)
         self.assertIsNotNone(service.audio_capture)
         self.assertIsNotNone(service.input_handler)
         self.assertIsNotNone(service.output_handler)
 
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_with_config_file(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
+    def test_stt_service_with_config_file(self):
         """Test STTService initialization with config file."""
         config_file = '/tmp/test_config.yaml'
         
-        mock_config.return_value = self.config_dict
-        mock_engine.return_value = Mock()
-        mock_audio.return_value = Mock()
-        mock_hotkey.return_value = Mock()
-        mock_output.return_value = Mock()
-        
         service = STTService(config_file)
         
-        mock_config.assert_called_once_with(config_file)
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_start(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
+        self.mock_config.assert_called_once_with(config_file)
+        self.assertIs(service.config, self.config)
+
+    def test_stt_service_start(self):
         """Test starting the STT service."""
-        # Setup mocks
-        mock_config.return_value = self.config_dict
-        mock_engine.return_value = Mock()
-        mock_audio.return_value = Mock()
-        mock_hotkey_instance = Mock()
-        mock_hotkey.return_value = mock_hotkey_instance
-        mock_output.return_value = Mock()
-        
-        service = STTService()
+        service = self._stub_service()
         service.start()
+        # Joins the stt-worker thread so it does not outlive the test
+        self.addCleanup(service.stop)
         
-        self.assertTrue(service.is_running)
-        mock_hotkey_instance.start.assert_called_once()
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_stop(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
+        self.assertTrue(service._started_event.wait(1.0))
+        self.assertTrue(service.is_running())
+        self.hotkey.start.assert_called_once()
+
+    def test_stt_service_stop(self):
         """Test stopping the STT service."""
-        # Setup mocks
-        mock_config.return_value = self.config_dict
-        mock_engine.return_value = Mock()
-        mock_audio.return_value = Mock()
-        mock_hotkey_instance = Mock()
-        mock_hotkey.return_value = mock_hotkey_instance
-        mock_output.return_value = Mock()
-        
-        service = STTService()
+        service = self._stub_service()
         service.start()
         service.stop()
         
-        self.assertFalse(service.is_running)
-        mock_hotkey_instance.stop.assert_called_once()
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_transcription_process(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
-        """Test the transcription process."""
-        # Setup mocks
-        mock_config.return_value = self.config_dict
-        mock_engine_instance = Mock()
-        mock_engine_instance.transcribe.return_value = "Hello world"
-        mock_engine.return_value = mock_engine_instance
+        self.assertFalse(service.is_running())
+        self.hotkey.stop.assert_called_once()
+        self.output.close.assert_called_once()
+        self.engine.close.assert_called_once()
+
+    def test_failed_start_leaves_no_worker(self):
+        """Test a failing input handler does not leak the worker thread."""
+        self.hotkey.start.side_effect = RuntimeError("pynput missing")
+        service = self._stub_service()
         
-        mock_audio_instance = Mock()
-        mock_audio_instance.start_recording.return_value = None
-        mock_audio_instance.stop_recording.return_value = b'fake_audio_data'
-        mock_audio.return_value = mock_audio_instance
+        with self.assertRaises(RuntimeError):
+            service.start()
         
-        mock_hotkey.return_value = Mock()
-        mock_output_instance = Mock()
-        mock_output.return_value = mock_output_instance
+        self.assertIsNone(service._worker)
+        self.assertFalse(service.is_running())
+
+    def test_stt_service_transcription_process(self):
+        """Test the transcription process."""
+        # The autospec has STTEngine's transcribe(audio, language) signature
+        self.engine.accepts_normalized = False
+        self.engine.transcribe.return_value = _FAKE_TRANSCRIPT
+        self.output.send_text.return_value = True
         
-        service = STTService()
+        service = self._stub_service()
         
-        # Simulate the transcription process
-        service._handle_speech_input()
+        # What the stt-worker thread does with each queued clip
+        service._process_audio(_FAKE_AUDIO)
         
-        mock_audio_instance.start_recording.assert_called_once()
-        mock_audio_instance.stop_recording.assert_called_once()
-        mock_engine_instance.transcribe.assert_called_once_with(b'fake_audio_data')
-        mock_output_instance.output.assert_called_once_with("Hello world")
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_context_manager(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
+        self.engine.transcribe.assert_called_once_with(_FAKE_AUDIO, 'en')
+        self.output.send_text.assert_called_once_with(_FAKE_TRANSCRIPT)
+        self.assertEqual(service._error_count, 0)
+
+    def test_stt_service_context_manager(self):
         """Test STTService as context manager."""
-        # Setup mocks
-        mock_config.return_value = self.config_dict
-        mock_engine.return_value = Mock()
-        mock_audio.return_value = Mock()
-        mock_hotkey_instance = Mock()
-        mock_hotkey.return_value = mock_hotkey_instance
-        mock_output.return_value = Mock()
-        
-        with STTService() as service:
+        with self._stub_service() as service:
             self.assertIsNotNone(service)
-            self.assertTrue(service.is_running)
+            self.assertTrue(service.is_running())
         
-        self.assertFalse(service.is_running)
-        mock_hotkey_instance.stop.assert_called_once()
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_error_handling(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
+        self.assertFalse(service.is_running())
+        self.hotkey.stop.assert_called_once()
+
+    def test_engine_without_normalized_keyword(self):
+        """Test engines with the plain transcribe(audio, language) signature."""
+        class LegacyEngine(STTEngine):
+            def load_model(self, model_path):
+                pass
+
+            def transcribe(self, audio, language=None):
+                return _FAKE_TRANSCRIPT
+
+            def is_ready(self):
+                return True
+
+        service = _StubService(LegacyEngine(), self.audio, self.hotkey, self.output)
+
+        self.assertEqual(service._transcribe_only(_FAKE_AUDIO), (_FAKE_TRANSCRIPT, None))
+
+    def test_stt_service_error_handling(self):
         """Test error handling in STT service."""
         # Setup mocks with some failures
-        mock_config.return_value = self.config_dict
-        mock_engine_instance = Mock()
-        mock_engine_instance.transcribe.side_effect = Exception("Transcription failed")
-        mock_engine.return_value = mock_engine_instance
-        
-        mock_audio_instance = Mock()
-        mock_audio_instance.stop_recording.return_value = b'fake_audio_data'
-        mock_audio.return_value = mock_audio_instance
+        self.engine.transcribe.side_effect = Exception(_TRANSCRIBE_ERROR)
         
-        mock_hotkey.return_value = Mock()
-        mock_output.return_value = Mock()
-        
-        service = STTService()
+        service = self._stub_service()
         
         # Should handle transcription errors gracefully
         try:
-            service._handle_speech_input()
+            service._process_audio(_FAKE_AUDIO)
         except Exception:
             self.fail("STTService should handle transcription errors gracefully")
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_configuration_updates(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
-        """Test configuration updates."""
-        # Setup mocks
-        mock_config_instance = Mock()
-        mock_config_instance.language = 'en'
-        mock_config_instance.engine = 'dummy'
-        mock_config_instance.update = Mock()
-        mock_config.return_value = mock_config_instance
-        
-        mock_engine.return_value = Mock()
-        mock_audio.return_value = Mock()
-        mock_hotkey.return_value = Mock()
-        mock_output.return_value = Mock()
-        
-        service = STTService()
-        
-        # Test config updates
-        new_config = {'language': 'es', 'engine': 'whisper'}
-        service.update_config(new_config)
-        
-        mock_config_instance.update.assert_called_once_with(new_config)
-
-    @patch('stt_service.service.Config')
-    @patch('stt_service.service.create_engine')
-    @patch('stt_service.service.AudioCapture')
-    @patch('stt_service.service.create_hotkey_handler')
-    @patch('stt_service.service.create_output_handler')
-    def test_stt_service_status_reporting(self, mock_output, mock_hotkey, mock_audio, mock_engine, mock_config):
-        """Test service status reporting."""
-        # Setup mocks
-        mock_config.return_value = self.config_dict
-        mock_engine_instance = Mock()
-        mock_engine_instance.is_available.return_value = True
-        mock_engine.return_value = mock_engine_instance
-        
-        mock_audio_instance = Mock()
-        mock_audio.return_value = mock_audio_instance
-        
-        mock_hotkey_instance = Mock()
-        mock_hotkey.return_value = mock_hotkey_instance
-        
-        mock_output_instance = Mock()
-        mock_output_instance.is_available.return_value = True
-        mock_output.return_value = mock_output_instance
-        
-        service = STTService()
-        status = service.get_status()
         
-        self.assertIsInstance(status, dict)
-        self.assertIn('is_running', status)
-        self.assertIn('engine_available', status)
-        self.assertIn('output_available', status)
+        self.output.send_text.assert_not_called()
+        self.assertEqual(service._error_count, 1)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()